@@ -164,7 +164,7 @@ async def test_generate_structured_data_legacy(
     )
 
     assert result.data == {"characters": ["Mario", "Luigi"]}
-    assert mock_create_stream.call_args.kwargs.copy() == snapshot
+    assert mock_create_stream.call_args.kwargs == snapshot
 
 
 @freeze_time("2026-01-01 12:00:00")
@@ -216,7 +216,7 @@ async def test_generate_structured_data_legacy_tools(
     )
 
     assert result.data == {"characters": ["Mario", "Luigi"]}
-    assert mock_create_stream.call_args.kwargs.copy() == snapshot
+    assert mock_create_stream.call_args.kwargs == snapshot
 
 
 @freeze_time("2026-01-01 12:00:00")
@@ -276,7 +276,7 @@ async def test_generate_structured_data_legacy_extended_thinking(
     )
 
     assert result.data == {"characters": ["Mario", "Luigi"]}
-    assert mock_create_stream.call_args.kwargs.copy() == snapshot
+    assert mock_create_stream.call_args.kwargs == snapshot
 
 
 @freeze_time("2026-01-01 12:00:00")
@@ -337,7 +337,7 @@ async def test_generate_structured_data_legacy_extra_text_block(
     )
 
     assert result.data == {"characters": ["Mario", "Luigi"]}
-    assert mock_create_stream.call_args.kwargs.copy() == snapshot
+    assert mock_create_stream.call_args.kwargs == snapshot
 
 
 async def test_generate_invalid_structured_data_legacy(
@@ -420,7 +420,7 @@ async def test_generate_structured_data(
     )
 
     assert result.data == {"characters": ["Mario", "Luigi"]}
-    assert mock_create_stream.call_args.kwargs.copy() == snapshot
+    assert mock_create_stream.call_args.kwargs == snapshot
 
 
 async def test_generate_data_with_attachments(
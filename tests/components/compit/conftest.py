@@ -8,7 +8,9 @@ import pytest
 
 from homeassistant.components.compit.const import DOMAIN
 from homeassistant.const import CONF_EMAIL
+from homeassistant.core import HomeAssistant
 
+from . import setup_integration
 from .consts import CONFIG_INPUT
 
 from tests.common import MockConfigEntry
@@ -134,3 +136,12 @@ def mock_connector():
         ),
     ):
         yield mock_instance
+
+
+@pytest.fixture
+async def init_integration(
+    hass: HomeAssistant, mock_config_entry: MockConfigEntry, mock_connector: MagicMock
+) -> MockConfigEntry:
+    """Set up the Compit integration for testing."""
+    await setup_integration(hass, mock_config_entry)
+    return mock_config_entry
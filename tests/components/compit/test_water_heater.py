@@ -16,17 +16,16 @@ from . import setup_integration, snapshot_compit_entities
 
 from tests.common import MockConfigEntry
 
+ENTITY_ID = "water_heater.r_900"
 
+
+@pytest.mark.usefixtures("init_integration")
 async def test_water_heater_entities_snapshot(
     hass: HomeAssistant,
     entity_registry: er.EntityRegistry,
-    mock_config_entry: MockConfigEntry,
-    mock_connector: MagicMock,
     snapshot: SnapshotAssertion,
 ) -> None:
     """Snapshot test for water heater entities creation, unique IDs, and device info."""
-    await setup_integration(hass, mock_config_entry)
-
     snapshot_compit_entities(hass, entity_registry, snapshot, Platform.WATER_HEATER)
 
 
@@ -44,28 +43,26 @@ async def test_water_heater_unknown_temperature(
     mock_return_value: Any,
 ) -> None:
     """Test water heater shows unknown temp for invalid values."""
-    mock_connector.get_current_value.side_effect = lambda device_id, parameter_code: (
-        mock_return_value
-    )
+    mock_connector.get_current_value.side_effect = None
+    mock_connector.get_current_value.return_value = mock_return_value
     await setup_integration(hass, mock_config_entry)
 
-    state = hass.states.get("water_heater.r_900")
+    state = hass.states.get(ENTITY_ID)
     assert state is not None
     assert state.attributes.get("temperature") is None
     assert state.attributes.get("current_temperature") is None
 
 
+@pytest.mark.usefixtures("init_integration")
 async def test_water_heater_set_temperature(
-    hass: HomeAssistant, mock_config_entry: MockConfigEntry, mock_connector: MagicMock
+    hass: HomeAssistant, mock_connector: MagicMock
 ) -> None:
     """Test setting water heater temperature."""
-    await setup_integration(hass, mock_config_entry)
-
     await hass.services.async_call(
         "water_heater",
         "set_temperature",
         {
-            ATTR_ENTITY_ID: "water_heater.r_900",
+            ATTR_ENTITY_ID: ENTITY_ID,
             ATTR_TEMPERATURE: 60.0,
         },
         blocking=True,
@@ -78,59 +75,57 @@ async def test_water_heater_set_temperature(
     )
 
 
-async def test_water_heater_turn_on(
-    hass: HomeAssistant, mock_config_entry: MockConfigEntry, mock_connector: MagicMock
+@pytest.mark.parametrize(
+    ("initial_option", "service", "expected_option"),
+    [
+        ("off", "turn_on", "on"),
+        ("on", "turn_off", "off"),
+    ],
+)
+async def test_water_heater_turn_on_off(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_connector: MagicMock,
+    initial_option: str,
+    service: str,
+    expected_option: str,
 ) -> None:
-    """Test turning water heater on."""
-    await mock_connector.select_device_option(1, CompitParameter.DHW_ON_OFF, "off")
-    await setup_integration(hass, mock_config_entry)
-
-    await hass.services.async_call(
-        "water_heater",
-        "turn_on",
-        {ATTR_ENTITY_ID: "water_heater.r_900"},
-        blocking=True,
+    """Test turning water heater on and off."""
+    await mock_connector.select_device_option(
+        1, CompitParameter.DHW_ON_OFF, initial_option
     )
-
-    assert mock_connector.get_current_option(1, CompitParameter.DHW_ON_OFF) == "on"
-
-
-async def test_water_heater_turn_off(
-    hass: HomeAssistant, mock_config_entry: MockConfigEntry, mock_connector: MagicMock
-) -> None:
-    """Test turning water heater off."""
-    await mock_connector.select_device_option(1, CompitParameter.DHW_ON_OFF, "on")
     await setup_integration(hass, mock_config_entry)
 
     await hass.services.async_call(
         "water_heater",
-        "turn_off",
-        {ATTR_ENTITY_ID: "water_heater.r_900"},
+        service,
+        {ATTR_ENTITY_ID: ENTITY_ID},
         blocking=True,
     )
 
-    assert mock_connector.get_current_option(1, CompitParameter.DHW_ON_OFF) == "off"
+    assert (
+        mock_connector.get_current_option(1, CompitParameter.DHW_ON_OFF)
+        == expected_option
+    )
 
 
+@pytest.mark.usefixtures("init_integration")
 async def test_water_heater_current_operation(
-    hass: HomeAssistant, mock_config_entry: MockConfigEntry, mock_connector: MagicMock
+    hass: HomeAssistant, mock_connector: MagicMock
 ) -> None:
     """Test water heater current operation state."""
-    await setup_integration(hass, mock_config_entry)
-
-    state = hass.states.get("water_heater.r_900")
+    state = hass.states.get(ENTITY_ID)
     assert state is not None
     assert state.state == "performance"
 
     await hass.services.async_call(
         "water_heater",
         "set_operation_mode",
-        {ATTR_ENTITY_ID: "water_heater.r_900", "operation_mode": "eco"},
+        {ATTR_ENTITY_ID: ENTITY_ID, "operation_mode": "eco"},
         blocking=True,
     )
-    await hass.async_block_till_done()
 
-    state = hass.states.get("water_heater.r_900")
+    state = hass.states.get(ENTITY_ID)
     assert state.state == "eco"
     assert (
         mock_connector.get_current_option(1, CompitParameter.DHW_ON_OFF) == "schedule"
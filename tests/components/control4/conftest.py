@@ -1,6 +1,6 @@
 """Common fixtures for the Control4 tests."""
 
-from collections.abc import AsyncGenerator, Generator
+from collections.abc import Generator
 import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -95,24 +95,22 @@ def mock_c4_director() -> Generator[MagicMock]:
 @pytest.fixture
 def mock_update_variables() -> Generator[AsyncMock]:
     """Mock the update_variables_for_config_entry function."""
-
-    async def _mock_update_variables(*args, **kwargs):
-        return {
-            1: {
-                "POWER_STATE": True,
-                "CURRENT_VOLUME": 50,
-                "IS_MUTED": False,
-                "CURRENT_VIDEO_DEVICE": 100,
-                "CURRENT MEDIA INFO": {},
-                "PLAYING": False,
-                "PAUSED": False,
-                "STOPPED": False,
-            }
-        }
-
     with patch(
         "homeassistant.components.control4.media_player.update_variables_for_config_entry",
-        new=_mock_update_variables,
+        new=AsyncMock(
+            return_value={
+                1: {
+                    "POWER_STATE": True,
+                    "CURRENT_VOLUME": 50,
+                    "IS_MUTED": False,
+                    "CURRENT_VIDEO_DEVICE": 100,
+                    "CURRENT MEDIA INFO": {},
+                    "PLAYING": False,
+                    "PAUSED": False,
+                    "STOPPED": False,
+                }
+            }
+        ),
     ) as mock_update:
         yield mock_update
 
@@ -140,13 +138,9 @@ def mock_climate_update_variables(
     mock_climate_variables: dict,
 ) -> Generator[AsyncMock]:
     """Mock update_variables for climate platform."""
-
-    async def _mock_update_variables(*args, **kwargs):
-        return mock_climate_variables
-
     with patch(
         "homeassistant.components.control4.climate.update_variables_for_config_entry",
-        new=_mock_update_variables,
+        new=AsyncMock(return_value=mock_climate_variables),
     ) as mock_update:
         yield mock_update
 
@@ -174,7 +168,7 @@ def platforms() -> list[Platform]:
 
 
 @pytest.fixture(autouse=True)
-async def mock_patch_platforms(platforms: list[Platform]) -> AsyncGenerator[None]:
+def mock_patch_platforms(platforms: list[Platform]) -> Generator[None]:
     """Fixture to set up platforms for tests."""
     with patch("homeassistant.components.control4.PLATFORMS", platforms):
         yield
@@ -1,7 +1,7 @@
 """Fixtures for Daikin tests."""
 
 from collections.abc import Callable, Generator
-import re
+from functools import partial
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 import urllib.parse
@@ -14,7 +14,53 @@ type ZoneDevice = MagicMock
 
 def _decode_zone_values(value: str) -> list[str]:
     """Decode a semicolon separated list into zone values."""
-    return re.findall(r"[^;]+", urllib.parse.unquote(value))
+    return [part for part in urllib.parse.unquote(value).split(";") if part]
+
+
+_REPRESENT_STATIC_VALUES: dict[str, str] = {
+    "f_rate": "auto",
+    "f_dir": "3d",
+    "en_hol": "off",
+    "adv": "",
+}
+_REPRESENT_GETTERS: dict[str, Callable[[ZoneDevice], list[str] | str]] = {
+    "lztemp_h": lambda device: _decode_zone_values(device.values["lztemp_h"]),
+    "lztemp_c": lambda device: _decode_zone_values(device.values["lztemp_c"]),
+    "mode": lambda device: device._mode,
+    "htemp": lambda device: str(device.inside_temperature),
+    "otemp": lambda device: str(device.outside_temperature),
+}
+
+
+_ZONE_DEVICE_ATTRIBUTES: dict[str, Any] = {
+    "mac": "001122334455",
+    "support_away_mode": False,
+    "support_advanced_modes": False,
+    "support_fan_rate": False,
+    "support_swing_mode": False,
+    "support_outside_temperature": False,
+    "support_energy_consumption": False,
+    "support_humidity": False,
+    "support_compressor_frequency": False,
+    "compressor_frequency": 0,
+    "inside_temperature": 21.0,
+    "outside_temperature": 13.0,
+    "humidity": 40,
+    "current_total_power_consumption": 0.0,
+    "last_hour_cool_energy_consumption": 0.0,
+    "last_hour_heat_energy_consumption": 0.0,
+    "today_energy_consumption": 0.0,
+    "today_total_energy_consumption": 0.0,
+}
+
+
+def _represent(device: ZoneDevice, key: str) -> tuple[None, list[str] | str]:
+    """Return the mocked raw value for a Daikin device key."""
+    if (value := _REPRESENT_STATIC_VALUES.get(key)) is not None:
+        return (None, value)
+    if (getter := _REPRESENT_GETTERS.get(key)) is None:
+        return (None, "")
+    return (None, getter(device))
 
 
 def configure_zone_device(
@@ -50,49 +96,17 @@ def configure_zone_device(
 @pytest.fixture
 def zone_device() -> Generator[ZoneDevice]:
     """Return a mocked zone-capable Daikin device and patch its factory."""
-    device = MagicMock(name="DaikinZoneDevice")
-    device.mac = "001122334455"
+    device = MagicMock(name="DaikinZoneDevice", **_ZONE_DEVICE_ATTRIBUTES)
     device.fan_rate = []
     device.swing_modes = []
-    device.support_away_mode = False
-    device.support_advanced_modes = False
-    device.support_fan_rate = False
-    device.support_swing_mode = False
-    device.support_outside_temperature = False
-    device.support_energy_consumption = False
-    device.support_humidity = False
-    device.support_compressor_frequency = False
-    device.compressor_frequency = 0
-    device.inside_temperature = 21.0
-    device.outside_temperature = 13.0
-    device.humidity = 40
-    device.current_total_power_consumption = 0.0
-    device.last_hour_cool_energy_consumption = 0.0
-    device.last_hour_heat_energy_consumption = 0.0
-    device.today_energy_consumption = 0.0
-    device.today_total_energy_consumption = 0.0
 
     configure_zone_device(device, zones=[["Living", "1", 22]])
 
-    def _represent(key: str) -> tuple[None, list[str] | str]:
-        dynamic_values: dict[str, Callable[[], list[str] | str]] = {
-            "lztemp_h": lambda: _decode_zone_values(device.values["lztemp_h"]),
-            "lztemp_c": lambda: _decode_zone_values(device.values["lztemp_c"]),
-            "mode": lambda: device._mode,
-            "f_rate": lambda: "auto",
-            "f_dir": lambda: "3d",
-            "en_hol": lambda: "off",
-            "adv": lambda: "",
-            "htemp": lambda: str(device.inside_temperature),
-            "otemp": lambda: str(device.outside_temperature),
-        }
-        return (None, dynamic_values.get(key, lambda: "")())
-
     async def _set(values: dict[str, Any]) -> None:
         if mode := values.get("mode"):
             device._mode = mode
 
-    device.represent = MagicMock(side_effect=_represent)
+    device.represent = MagicMock(side_effect=partial(_represent, device))
     device.update_status = AsyncMock()
     device.set = AsyncMock(side_effect=_set)
     device.set_zone = AsyncMock()
@@ -1,5 +1,7 @@
 """Test energy data storage and migration."""
 
+from typing import Any
+
 import pytest
 import voluptuous as vol
 
@@ -9,14 +11,37 @@ from homeassistant.components.energy.data import (
     FLOW_TO_GRID_SOURCE_SCHEMA,
     GAS_SOURCE_SCHEMA,
     POWER_CONFIG_SCHEMA,
+    STORAGE_KEY,
     WATER_SOURCE_SCHEMA,
     EnergyManager,
 )
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers import storage
 
 
-async def test_energy_preferences_no_migration_needed(hass: HomeAssistant) -> None:
+def _seed_store(
+    hass_storage: dict[str, Any], minor_version: int, data: dict[str, Any]
+) -> None:
+    """Store energy preferences in the given minor version of the format."""
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "minor_version": minor_version,
+        "key": STORAGE_KEY,
+        "data": data,
+    }
+
+
+@pytest.fixture
+def energy_manager(hass: HomeAssistant) -> EnergyManager:
+    """Return an energy manager with default preferences."""
+    # No need to load the (empty) store, the preferences are replaced anyway
+    manager = EnergyManager(hass)
+    manager.data = manager.default_preferences()
+    return manager
+
+
+async def test_energy_preferences_no_migration_needed(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
     """Test that new data format doesn't get migrated."""
     # Create new format data (already has device_consumption_water field)
     new_data = {
@@ -28,8 +53,7 @@ async def test_energy_preferences_no_migration_needed(hass: HomeAssistant) -> No
     }
 
     # Save data that already has the new field
-    old_store = storage.Store(hass, 1, "energy", minor_version=1)
-    await old_store.async_save(new_data)
+    _seed_store(hass_storage, 1, new_data)
 
     # Load it with manager
     manager = EnergyManager(hass)
@@ -42,7 +66,7 @@ async def test_energy_preferences_no_migration_needed(hass: HomeAssistant) -> No
     ]
 
 
-async def test_energy_preferences_default(hass: HomeAssistant) -> None:
+def test_energy_preferences_default() -> None:
     """Test default preferences include device_consumption_water."""
     defaults = EnergyManager.default_preferences()
 
@@ -63,6 +87,7 @@ async def test_energy_preferences_empty_store(hass: HomeAssistant) -> None:
 
 async def test_energy_preferences_migration_from_old_version(
     hass: HomeAssistant,
+    hass_storage: dict[str, Any],
 ) -> None:
     """Test that device_consumption_water is added when migrating from v1.1 to v1.2."""
     # Create version 1.1 data without device_consumption_water (old version)
@@ -72,8 +97,7 @@ async def test_energy_preferences_migration_from_old_version(
     }
 
     # Save with old version (1.1) - migration will run to upgrade to 1.2
-    old_store = storage.Store(hass, 1, "energy", minor_version=1)
-    await old_store.async_save(old_data)
+    _seed_store(hass_storage, 1, old_data)
 
     # Load with manager - should trigger migration
     manager = EnergyManager(hass)
@@ -85,80 +109,135 @@ async def test_energy_preferences_migration_from_old_version(
     assert manager.data["device_consumption_water"] == []
 
 
-async def test_battery_power_config_inverted_sets_stat_rate(
-    hass: HomeAssistant,
-) -> None:
-    """Test battery with inverted power_config sets stat_rate."""
-    manager = EnergyManager(hass)
-    await manager.async_initialize()
-    manager.data = manager.default_preferences()
-
-    await manager.async_update(
-        {
-            "energy_sources": [
-                {
-                    "type": "battery",
-                    "stat_energy_from": "sensor.battery_energy_from",
-                    "stat_energy_to": "sensor.battery_energy_to",
-                    "power_config": {
-                        "stat_rate_inverted": "sensor.battery_power",
-                    },
-                }
-            ],
-        }
-    )
-
-    # Verify stat_rate was set to the expected entity_id
-    assert manager.data is not None
-    assert len(manager.data["energy_sources"]) == 1
-    source = manager.data["energy_sources"][0]
-    assert source["stat_rate"] == "sensor.battery_power_inverted"
-    # Verify power_config is preserved
-    assert source["power_config"] == {"stat_rate_inverted": "sensor.battery_power"}
-
-
-async def test_battery_power_config_two_sensors_sets_stat_rate(
-    hass: HomeAssistant,
+@pytest.mark.parametrize(
+    ("source", "expected_stat_rate"),
+    [
+        pytest.param(
+            {
+                "type": "battery",
+                "stat_energy_from": "sensor.battery_energy_from",
+                "stat_energy_to": "sensor.battery_energy_to",
+                "power_config": {
+                    "stat_rate_inverted": "sensor.battery_power",
+                },
+            },
+            "sensor.battery_power_inverted",
+            id="battery_inverted",
+        ),
+        pytest.param(
+            {
+                "type": "battery",
+                "stat_energy_from": "sensor.battery_energy_from",
+                "stat_energy_to": "sensor.battery_energy_to",
+                "power_config": {
+                    "stat_rate_from": "sensor.battery_discharge",
+                    "stat_rate_to": "sensor.battery_charge",
+                },
+            },
+            # Entity ID includes discharge sensor name to avoid collisions
+            "sensor.energy_battery_battery_discharge_battery_charge_net_power",
+            id="battery_two_sensors",
+        ),
+        pytest.param(
+            {
+                "type": "battery",
+                "stat_energy_from": "sensor.battery_energy_from",
+                "stat_energy_to": "sensor.battery_energy_to",
+                "power_config": {
+                    "stat_rate": "sensor.battery_power",
+                },
+            },
+            # stat_rate should be set directly from power_config.stat_rate
+            "sensor.battery_power",
+            id="battery_standard",
+        ),
+        pytest.param(
+            {
+                "type": "battery",
+                "stat_energy_from": "sensor.battery_energy_from",
+                "stat_energy_to": "sensor.battery_energy_to",
+                "stat_rate": "sensor.battery_power",
+            },
+            "sensor.battery_power",
+            id="battery_without_power_config",
+        ),
+        pytest.param(
+            # Frontend sends both stat_rate and power_config
+            {
+                "type": "battery",
+                "stat_energy_from": "sensor.battery_energy_from",
+                "stat_energy_to": "sensor.battery_energy_to",
+                "stat_rate": "sensor.battery_power",  # This should be ignored
+                "power_config": {
+                    "stat_rate_inverted": "sensor.battery_power",
+                },
+            },
+            # stat_rate should be overwritten to point to the generated inverted sensor
+            "sensor.battery_power_inverted",
+            id="power_config_takes_precedence",
+        ),
+        pytest.param(
+            {
+                "type": "grid",
+                "stat_energy_from": "sensor.grid_import",
+                "stat_energy_to": None,
+                "stat_cost": None,
+                "stat_compensation": None,
+                "entity_energy_price": None,
+                "number_energy_price": None,
+                "entity_energy_price_export": None,
+                "number_energy_price_export": None,
+                "power_config": {
+                    "stat_rate_inverted": "sensor.grid_power",
+                },
+                "cost_adjustment_day": 0,
+            },
+            "sensor.grid_power_inverted",
+            id="grid_inverted",
+        ),
+        pytest.param(
+            {
+                "type": "grid",
+                "stat_energy_from": "sensor.grid_import",
+                "stat_energy_to": None,
+                "stat_cost": None,
+                "stat_compensation": None,
+                "entity_energy_price": None,
+                "number_energy_price": None,
+                "entity_energy_price_export": None,
+                "number_energy_price_export": None,
+                "power_config": {
+                    "stat_rate": "sensor.grid_power",
+                },
+                "cost_adjustment_day": 0,
+            },
+            # stat_rate should be set directly from power_config.stat_rate
+            "sensor.grid_power",
+            id="grid_standard",
+        ),
+    ],
+)
+async def test_power_config_sets_stat_rate(
+    energy_manager: EnergyManager,
+    source: dict[str, Any],
+    expected_stat_rate: str,
 ) -> None:
-    """Test that battery with two-sensor power_config sets stat_rate."""
-    manager = EnergyManager(hass)
-    await manager.async_initialize()
-    manager.data = manager.default_preferences()
-
-    await manager.async_update(
-        {
-            "energy_sources": [
-                {
-                    "type": "battery",
-                    "stat_energy_from": "sensor.battery_energy_from",
-                    "stat_energy_to": "sensor.battery_energy_to",
-                    "power_config": {
-                        "stat_rate_from": "sensor.battery_discharge",
-                        "stat_rate_to": "sensor.battery_charge",
-                    },
-                }
-            ],
-        }
-    )
+    """Test that async_update sets stat_rate from the power configuration."""
+    await energy_manager.async_update({"energy_sources": [source]})
 
-    assert manager.data is not None
-    source = manager.data["energy_sources"][0]
-    # Entity ID includes discharge sensor name to avoid collisions
-    assert (
-        source["stat_rate"]
-        == "sensor.energy_battery_battery_discharge_battery_charge_net_power"
-    )
+    assert energy_manager.data is not None
+    assert len(energy_manager.data["energy_sources"]) == 1
+    processed = energy_manager.data["energy_sources"][0]
+    assert processed["stat_rate"] == expected_stat_rate
+    # Verify power_config is preserved as given
+    assert processed.get("power_config") == source.get("power_config")
 
 
 async def test_battery_stat_soc_round_trip(
-    hass: HomeAssistant,
+    energy_manager: EnergyManager,
 ) -> None:
     """Test that battery stat_soc is preserved through async_update."""
-    manager = EnergyManager(hass)
-    await manager.async_initialize()
-    manager.data = manager.default_preferences()
-
-    await manager.async_update(
+    await energy_manager.async_update(
         {
             "energy_sources": [
                 {
@@ -171,19 +250,15 @@ async def test_battery_stat_soc_round_trip(
         }
     )
 
-    assert manager.data is not None
-    source = manager.data["energy_sources"][0]
+    assert energy_manager.data is not None
+    source = energy_manager.data["energy_sources"][0]
     assert source["stat_soc"] == "sensor.battery_state_of_charge"
 
 
 async def test_battery_capacity_round_trip(
-    hass: HomeAssistant,
+    energy_manager: EnergyManager,
 ) -> None:
     """Test that battery capacity is preserved through async_update."""
-    manager = EnergyManager(hass)
-    await manager.async_initialize()
-    manager.data = manager.default_preferences()
-
     battery_source = {
         "type": "battery",
         "stat_energy_from": "sensor.battery_energy_from",
@@ -192,175 +267,50 @@ async def test_battery_capacity_round_trip(
     }
     sources = ENERGY_SOURCE_SCHEMA([battery_source])
 
-    await manager.async_update({"energy_sources": sources})
+    await energy_manager.async_update({"energy_sources": sources})
 
-    assert manager.data is not None
-    assert manager.data["energy_sources"][0]["capacity"] == 13.5
+    assert energy_manager.data is not None
+    assert energy_manager.data["energy_sources"][0]["capacity"] == 13.5
     with pytest.raises(vol.Invalid):
         ENERGY_SOURCE_SCHEMA([{**battery_source, "capacity": 0}])
     with pytest.raises(vol.Invalid):
         ENERGY_SOURCE_SCHEMA([{**battery_source, "capacity": -1}])
 
 
-async def test_grid_power_config_inverted_sets_stat_rate(
-    hass: HomeAssistant,
-) -> None:
-    """Test that grid with inverted power_config sets stat_rate."""
-    manager = EnergyManager(hass)
-    await manager.async_initialize()
-    manager.data = manager.default_preferences()
-
-    await manager.async_update(
-        {
-            "energy_sources": [
-                {
-                    "type": "grid",
-                    "stat_energy_from": "sensor.grid_import",
-                    "stat_energy_to": None,
-                    "stat_cost": None,
-                    "stat_compensation": None,
-                    "entity_energy_price": None,
-                    "number_energy_price": None,
-                    "entity_energy_price_export": None,
-                    "number_energy_price_export": None,
-                    "power_config": {
-                        "stat_rate_inverted": "sensor.grid_power",
-                    },
-                    "cost_adjustment_day": 0,
-                }
-            ],
-        }
-    )
-
-    assert manager.data is not None
-    grid_source = manager.data["energy_sources"][0]
-    assert grid_source["stat_rate"] == "sensor.grid_power_inverted"
-
-
-async def test_power_config_standard_uses_stat_rate_directly(
-    hass: HomeAssistant,
-) -> None:
-    """Test that power_config with standard stat_rate uses it directly."""
-    manager = EnergyManager(hass)
-    await manager.async_initialize()
-    manager.data = manager.default_preferences()
-
-    await manager.async_update(
-        {
-            "energy_sources": [
-                {
-                    "type": "battery",
-                    "stat_energy_from": "sensor.battery_energy_from",
-                    "stat_energy_to": "sensor.battery_energy_to",
-                    "power_config": {
-                        "stat_rate": "sensor.battery_power",
-                    },
-                }
-            ],
-        }
-    )
-
-    assert manager.data is not None
-    source = manager.data["energy_sources"][0]
-    # stat_rate should be set directly from power_config.stat_rate
-    assert source["stat_rate"] == "sensor.battery_power"
-
-
-async def test_battery_without_power_config_unchanged(hass: HomeAssistant) -> None:
-    """Test that battery without power_config is unchanged."""
-    manager = EnergyManager(hass)
-    await manager.async_initialize()
-    manager.data = manager.default_preferences()
-
-    await manager.async_update(
-        {
-            "energy_sources": [
-                {
-                    "type": "battery",
-                    "stat_energy_from": "sensor.battery_energy_from",
-                    "stat_energy_to": "sensor.battery_energy_to",
-                    "stat_rate": "sensor.battery_power",
-                }
-            ],
-        }
-    )
-
-    assert manager.data is not None
-    source = manager.data["energy_sources"][0]
-    assert source["stat_rate"] == "sensor.battery_power"
-    assert "power_config" not in source
-
-
-async def test_power_config_takes_precedence_over_stat_rate(
-    hass: HomeAssistant,
-) -> None:
-    """Test that power_config takes precedence when both are provided."""
-    manager = EnergyManager(hass)
-    await manager.async_initialize()
-    manager.data = manager.default_preferences()
-
-    # Frontend sends both stat_rate and power_config
-    await manager.async_update(
-        {
-            "energy_sources": [
-                {
-                    "type": "battery",
-                    "stat_energy_from": "sensor.battery_energy_from",
-                    "stat_energy_to": "sensor.battery_energy_to",
-                    "stat_rate": "sensor.battery_power",  # This should be ignored
-                    "power_config": {
-                        "stat_rate_inverted": "sensor.battery_power",
-                    },
-                }
-            ],
-        }
-    )
-
-    assert manager.data is not None
-    source = manager.data["energy_sources"][0]
-    # stat_rate should be overwritten to point to the generated inverted sensor
-    assert source["stat_rate"] == "sensor.battery_power_inverted"
-
-
-async def test_power_config_validation_empty() -> None:
+def test_power_config_validation_empty() -> None:
     """Test that empty power_config raises validation error."""
     with pytest.raises(vol.Invalid, match="power_config must have at least one option"):
         POWER_CONFIG_SCHEMA({})
 
 
-async def test_power_config_validation_multiple_methods() -> None:
+@pytest.mark.parametrize(
+    "power_config",
+    [
+        {
+            "stat_rate": "sensor.power",
+            "stat_rate_inverted": "sensor.power",
+        },
+        {
+            "stat_rate": "sensor.power",
+            "stat_rate_from": "sensor.discharge",
+            "stat_rate_to": "sensor.charge",
+        },
+        {
+            "stat_rate_inverted": "sensor.power",
+            "stat_rate_from": "sensor.discharge",
+            "stat_rate_to": "sensor.charge",
+        },
+    ],
+)
+def test_power_config_validation_multiple_methods(
+    power_config: dict[str, str],
+) -> None:
     """Test that power_config with multiple methods raises validation error."""
-    # Both stat_rate and stat_rate_inverted (should fail due to Exclusive)
-    with pytest.raises(vol.Invalid):
-        POWER_CONFIG_SCHEMA(
-            {
-                "stat_rate": "sensor.power",
-                "stat_rate_inverted": "sensor.power",
-            }
-        )
-
-    # Both stat_rate and stat_rate_from/to (should fail due to Exclusive)
-    with pytest.raises(vol.Invalid):
-        POWER_CONFIG_SCHEMA(
-            {
-                "stat_rate": "sensor.power",
-                "stat_rate_from": "sensor.discharge",
-                "stat_rate_to": "sensor.charge",
-            }
-        )
-
-    # Both stat_rate_inverted and stat_rate_from/to (should fail due to Exclusive)
     with pytest.raises(vol.Invalid):
-        POWER_CONFIG_SCHEMA(
-            {
-                "stat_rate_inverted": "sensor.power",
-                "stat_rate_from": "sensor.discharge",
-                "stat_rate_to": "sensor.charge",
-            }
-        )
+        POWER_CONFIG_SCHEMA(power_config)
 
 
-async def test_flow_from_validation_multiple_prices() -> None:
+def test_flow_from_validation_multiple_prices() -> None:
     """Test that flow_from validation rejects both entity and number price."""
     # Both entity_energy_price and number_energy_price should fail
     with pytest.raises(
@@ -375,7 +325,7 @@ async def test_flow_from_validation_multiple_prices() -> None:
         )
 
 
-async def test_energy_sources_validation_multiple_grids() -> None:
+def test_energy_sources_validation_multiple_grids() -> None:
     """Test that multiple grid sources are allowed (like batteries)."""
     # Multiple grid sources should now pass validation
     result = ENERGY_SOURCE_SCHEMA(
@@ -399,7 +349,7 @@ async def test_energy_sources_validation_multiple_grids() -> None:
     assert result[1]["stat_energy_from"] == "sensor.grid2_import"
 
 
-async def test_power_config_validation_passes() -> None:
+def test_power_config_validation_passes() -> None:
     """Test that valid power_config passes validation."""
     # Test standard stat_rate
     result = POWER_CONFIG_SCHEMA({"stat_rate": "sensor.power"})
@@ -419,41 +369,7 @@ async def test_power_config_validation_passes() -> None:
     }
 
 
-async def test_grid_power_config_standard_stat_rate(hass: HomeAssistant) -> None:
-    """Test that grid with power_config using standard stat_rate works correctly."""
-    manager = EnergyManager(hass)
-    await manager.async_initialize()
-    manager.data = manager.default_preferences()
-
-    await manager.async_update(
-        {
-            "energy_sources": [
-                {
-                    "type": "grid",
-                    "stat_energy_from": "sensor.grid_import",
-                    "stat_energy_to": None,
-                    "stat_cost": None,
-                    "stat_compensation": None,
-                    "entity_energy_price": None,
-                    "number_energy_price": None,
-                    "entity_energy_price_export": None,
-                    "number_energy_price_export": None,
-                    "power_config": {
-                        "stat_rate": "sensor.grid_power",
-                    },
-                    "cost_adjustment_day": 0,
-                }
-            ],
-        }
-    )
-
-    assert manager.data is not None
-    grid_source = manager.data["energy_sources"][0]
-    # stat_rate should be set directly from power_config.stat_rate
-    assert grid_source["stat_rate"] == "sensor.grid_power"
-
-
-async def test_grid_new_format_validates_correctly() -> None:
+def test_grid_new_format_validates_correctly() -> None:
     """Test that new unified grid format validates correctly."""
     # Valid grid source with import and export
     result = ENERGY_SOURCE_SCHEMA(
@@ -520,13 +436,9 @@ async def test_async_update_when_data_is_none(hass: HomeAssistant) -> None:
     assert manager.data["device_consumption_water"] == []
 
 
-async def test_grid_power_without_power_config(hass: HomeAssistant) -> None:
+async def test_grid_power_without_power_config(energy_manager: EnergyManager) -> None:
     """Test that grid without power_config is preserved unchanged."""
-    manager = EnergyManager(hass)
-    await manager.async_initialize()
-    manager.data = manager.default_preferences()
-
-    await manager.async_update(
+    await energy_manager.async_update(
         {
             "energy_sources": [
                 {
@@ -547,14 +459,16 @@ async def test_grid_power_without_power_config(hass: HomeAssistant) -> None:
         }
     )
 
-    assert manager.data is not None
-    grid_source = manager.data["energy_sources"][0]
+    assert energy_manager.data is not None
+    grid_source = energy_manager.data["energy_sources"][0]
     # stat_rate should be preserved unchanged
     assert grid_source["stat_rate"] == "sensor.grid_power"
     assert "power_config" not in grid_source
 
 
-async def test_grid_migration_single_import_export(hass: HomeAssistant) -> None:
+async def test_grid_migration_single_import_export(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
     """Test migration from legacy format with 1 import + 1 export creates 1 grid."""
     # Create legacy format data (v1.2) with flow_from/flow_to arrays
     old_data = {
@@ -585,8 +499,7 @@ async def test_grid_migration_single_import_export(hass: HomeAssistant) -> None:
     }
 
     # Save with old version (1.2) - migration will run to upgrade to 1.3
-    old_store = storage.Store(hass, 1, "energy", minor_version=2)
-    await old_store.async_save(old_data)
+    _seed_store(hass_storage, 2, old_data)
 
     # Load with manager - should trigger migration
     manager = EnergyManager(hass)
@@ -613,6 +526,7 @@ async def test_grid_migration_single_import_export(hass: HomeAssistant) -> None:
 
 async def test_grid_migration_multiple_imports_exports_paired(
     hass: HomeAssistant,
+    hass_storage: dict[str, Any],
 ) -> None:
     """Test migration with 2 imports + 2 exports creates 2 paired grids."""
     old_data = {
@@ -654,8 +568,7 @@ async def test_grid_migration_multiple_imports_exports_paired(
         "device_consumption_water": [],
     }
 
-    old_store = storage.Store(hass, 1, "energy", minor_version=2)
-    await old_store.async_save(old_data)
+    _seed_store(hass_storage, 2, old_data)
 
     manager = EnergyManager(hass)
     await manager.async_initialize()
@@ -678,7 +591,9 @@ async def test_grid_migration_multiple_imports_exports_paired(
     assert grid2["number_energy_price_export"] == 0.05
 
 
-async def test_grid_migration_more_imports_than_exports(hass: HomeAssistant) -> None:
+async def test_grid_migration_more_imports_than_exports(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
     """Test migration with 3 imports + 1 export creates 3 grids (first has export)."""
     old_data = {
         "energy_sources": [
@@ -699,8 +614,7 @@ async def test_grid_migration_more_imports_than_exports(hass: HomeAssistant) ->
         "device_consumption_water": [],
     }
 
-    old_store = storage.Store(hass, 1, "energy", minor_version=2)
-    await old_store.async_save(old_data)
+    _seed_store(hass_storage, 2, old_data)
 
     manager = EnergyManager(hass)
     await manager.async_initialize()
@@ -723,7 +637,9 @@ async def test_grid_migration_more_imports_than_exports(hass: HomeAssistant) ->
     assert grid3["stat_energy_to"] is None
 
 
-async def test_grid_migration_with_power(hass: HomeAssistant) -> None:
+async def test_grid_migration_with_power(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
     """Test migration preserves power config and stat_rate from first grid.
 
     Note: Migration preserves the original stat_rate value from the legacy power array.
@@ -753,8 +669,7 @@ async def test_grid_migration_with_power(hass: HomeAssistant) -> None:
         "device_consumption_water": [],
     }
 
-    old_store = storage.Store(hass, 1, "energy", minor_version=2)
-    await old_store.async_save(old_data)
+    _seed_store(hass_storage, 2, old_data)
 
     manager = EnergyManager(hass)
     await manager.async_initialize()
@@ -770,7 +685,9 @@ async def test_grid_migration_with_power(hass: HomeAssistant) -> None:
     assert grid["stat_rate"] == "sensor.grid_power"
 
 
-async def test_grid_migration_import_only(hass: HomeAssistant) -> None:
+async def test_grid_migration_import_only(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
     """Test migration with imports but no exports creates import-only grids."""
     old_data = {
         "energy_sources": [
@@ -787,8 +704,7 @@ async def test_grid_migration_import_only(hass: HomeAssistant) -> None:
         "device_consumption_water": [],
     }
 
-    old_store = storage.Store(hass, 1, "energy", minor_version=2)
-    await old_store.async_save(old_data)
+    _seed_store(hass_storage, 2, old_data)
 
     manager = EnergyManager(hass)
     await manager.async_initialize()
@@ -801,7 +717,9 @@ async def test_grid_migration_import_only(hass: HomeAssistant) -> None:
     assert grid["stat_energy_to"] is None
 
 
-async def test_grid_migration_power_only(hass: HomeAssistant) -> None:
+async def test_grid_migration_power_only(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
     """Test migration with only power configured (no import/export meters)."""
     old_data = {
         "energy_sources": [
@@ -819,8 +737,7 @@ async def test_grid_migration_power_only(hass: HomeAssistant) -> None:
         "device_consumption_water": [],
     }
 
-    old_store = storage.Store(hass, 1, "energy", minor_version=2)
-    await old_store.async_save(old_data)
+    _seed_store(hass_storage, 2, old_data)
 
     manager = EnergyManager(hass)
     await manager.async_initialize()
@@ -838,7 +755,9 @@ async def test_grid_migration_power_only(hass: HomeAssistant) -> None:
     assert grid["cost_adjustment_day"] == 0.5
 
 
-async def test_grid_new_format_no_migration_needed(hass: HomeAssistant) -> None:
+async def test_grid_new_format_no_migration_needed(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
     """Test that new format data doesn't get migrated."""
     new_data = {
         "energy_sources": [
@@ -860,8 +779,7 @@ async def test_grid_new_format_no_migration_needed(hass: HomeAssistant) -> None:
     }
 
     # Save with current version (1.3)
-    old_store = storage.Store(hass, 1, "energy", minor_version=3)
-    await old_store.async_save(new_data)
+    _seed_store(hass_storage, 3, new_data)
 
     manager = EnergyManager(hass)
     await manager.async_initialize()
@@ -873,7 +791,7 @@ async def test_grid_new_format_no_migration_needed(hass: HomeAssistant) -> None:
     assert grid["stat_energy_to"] == "sensor.grid_export"
 
 
-async def test_grid_validation_single_import_price() -> None:
+def test_grid_validation_single_import_price() -> None:
     """Test that grid validation rejects both entity and number import price."""
     with pytest.raises(
         vol.Invalid, match="Define either an entity or a fixed number for import price"
@@ -891,7 +809,7 @@ async def test_grid_validation_single_import_price() -> None:
         )
 
 
-async def test_grid_validation_single_export_price() -> None:
+def test_grid_validation_single_export_price() -> None:
     """Test that grid validation rejects both entity and number export price."""
     with pytest.raises(
         vol.Invalid, match="Define either an entity or a fixed number for export price"
@@ -910,7 +828,7 @@ async def test_grid_validation_single_export_price() -> None:
         )
 
 
-async def test_flow_from_rejects_entity_price_for_external_stat() -> None:
+def test_flow_from_rejects_entity_price_for_external_stat() -> None:
     """Test that entity_energy_price is rejected for external statistics."""
     with pytest.raises(vol.Invalid, match="not supported for external statistics"):
         FLOW_FROM_GRID_SOURCE_SCHEMA(
@@ -921,7 +839,7 @@ async def test_flow_from_rejects_entity_price_for_external_stat() -> None:
         )
 
 
-async def test_flow_from_rejects_number_price_for_external_stat() -> None:
+def test_flow_from_rejects_number_price_for_external_stat() -> None:
     """Test that number_energy_price is rejected for external statistics."""
     with pytest.raises(vol.Invalid, match="not supported for external statistics"):
         FLOW_FROM_GRID_SOURCE_SCHEMA(
@@ -932,7 +850,7 @@ async def test_flow_from_rejects_number_price_for_external_stat() -> None:
         )
 
 
-async def test_flow_from_allows_stat_cost_for_external_stat() -> None:
+def test_flow_from_allows_stat_cost_for_external_stat() -> None:
     """Test that stat_cost is allowed for external statistics."""
     result = FLOW_FROM_GRID_SOURCE_SCHEMA(
         {
@@ -946,7 +864,7 @@ async def test_flow_from_allows_stat_cost_for_external_stat() -> None:
     assert result["stat_cost"] == "opower:utility_elec_12345_energy_cost"
 
 
-async def test_flow_from_allows_no_cost_for_external_stat() -> None:
+def test_flow_from_allows_no_cost_for_external_stat() -> None:
     """Test that external statistics with no cost config are allowed."""
     result = FLOW_FROM_GRID_SOURCE_SCHEMA(
         {
@@ -958,7 +876,7 @@ async def test_flow_from_allows_no_cost_for_external_stat() -> None:
     assert result["stat_energy_from"] == "opower:utility_elec_12345_energy_consumption"
 
 
-async def test_flow_to_rejects_entity_price_for_external_stat() -> None:
+def test_flow_to_rejects_entity_price_for_external_stat() -> None:
     """Test that entity_energy_price is rejected for external export statistics."""
     with pytest.raises(vol.Invalid, match="not supported for external statistics"):
         FLOW_TO_GRID_SOURCE_SCHEMA(
@@ -969,7 +887,7 @@ async def test_flow_to_rejects_entity_price_for_external_stat() -> None:
         )
 
 
-async def test_flow_to_rejects_number_price_for_external_stat() -> None:
+def test_flow_to_rejects_number_price_for_external_stat() -> None:
     """Test that number_energy_price is rejected for external export statistics."""
     with pytest.raises(vol.Invalid, match="not supported for external statistics"):
         FLOW_TO_GRID_SOURCE_SCHEMA(
@@ -980,7 +898,7 @@ async def test_flow_to_rejects_number_price_for_external_stat() -> None:
         )
 
 
-async def test_grid_rejects_entity_price_for_external_import_stat() -> None:
+def test_grid_rejects_entity_price_for_external_import_stat() -> None:
     """Test that grid schema rejects entity price for external import stats."""
     with pytest.raises(vol.Invalid, match="not supported for external statistics"):
         ENERGY_SOURCE_SCHEMA(
@@ -995,7 +913,7 @@ async def test_grid_rejects_entity_price_for_external_import_stat() -> None:
         )
 
 
-async def test_grid_rejects_number_price_for_external_export_stat() -> None:
+def test_grid_rejects_number_price_for_external_export_stat() -> None:
     """Test that grid schema rejects number price for external export stats."""
     with pytest.raises(vol.Invalid, match="not supported for external statistics"):
         ENERGY_SOURCE_SCHEMA(
@@ -1010,7 +928,7 @@ async def test_grid_rejects_number_price_for_external_export_stat() -> None:
         )
 
 
-async def test_grid_allows_stat_cost_for_external_stat() -> None:
+def test_grid_allows_stat_cost_for_external_stat() -> None:
     """Test that grid schema allows stat_cost with external statistics."""
     result = ENERGY_SOURCE_SCHEMA(
         [
@@ -1028,7 +946,7 @@ async def test_grid_allows_stat_cost_for_external_stat() -> None:
     assert result[0]["stat_cost"] == "opower:utility_elec_12345_energy_cost"
 
 
-async def test_gas_rejects_entity_price_for_external_stat() -> None:
+def test_gas_rejects_entity_price_for_external_stat() -> None:
     """Test that gas schema rejects entity price for external statistics."""
     with pytest.raises(vol.Invalid, match="not supported for external statistics"):
         GAS_SOURCE_SCHEMA(
@@ -1040,7 +958,7 @@ async def test_gas_rejects_entity_price_for_external_stat() -> None:
         )
 
 
-async def test_gas_rejects_number_price_for_external_stat() -> None:
+def test_gas_rejects_number_price_for_external_stat() -> None:
     """Test that gas schema rejects number price for external statistics."""
     with pytest.raises(vol.Invalid, match="not supported for external statistics"):
         GAS_SOURCE_SCHEMA(
@@ -1052,7 +970,7 @@ async def test_gas_rejects_number_price_for_external_stat() -> None:
         )
 
 
-async def test_water_rejects_entity_price_for_external_stat() -> None:
+def test_water_rejects_entity_price_for_external_stat() -> None:
     """Test that water schema rejects entity price for external statistics."""
     with pytest.raises(vol.Invalid, match="not supported for external statistics"):
         WATER_SOURCE_SCHEMA(
@@ -1064,7 +982,7 @@ async def test_water_rejects_entity_price_for_external_stat() -> None:
         )
 
 
-async def test_water_rejects_number_price_for_external_stat() -> None:
+def test_water_rejects_number_price_for_external_stat() -> None:
     """Test that water schema rejects number price for external statistics."""
     with pytest.raises(vol.Invalid, match="not supported for external statistics"):
         WATER_SOURCE_SCHEMA(
@@ -1076,7 +994,7 @@ async def test_water_rejects_number_price_for_external_stat() -> None:
         )
 
 
-async def test_flow_from_allows_price_with_stat_cost_for_external_stat() -> None:
+def test_flow_from_allows_price_with_stat_cost_for_external_stat() -> None:
     """Test that price fields are allowed when stat_cost is already set."""
     result = FLOW_FROM_GRID_SOURCE_SCHEMA(
         {
@@ -1090,7 +1008,7 @@ async def test_flow_from_allows_price_with_stat_cost_for_external_stat() -> None
     assert result["entity_energy_price"] == "input_number.electricity_rate"
 
 
-async def test_flow_to_allows_price_with_stat_compensation_for_external_stat() -> None:
+def test_flow_to_allows_price_with_stat_compensation_for_external_stat() -> None:
     """Test that price fields are allowed when stat_compensation is already set."""
     result = FLOW_TO_GRID_SOURCE_SCHEMA(
         {
@@ -1103,7 +1021,7 @@ async def test_flow_to_allows_price_with_stat_compensation_for_external_stat() -
     assert result["number_energy_price"] == 0.08
 
 
-async def test_grid_allows_price_with_stat_cost_for_external_stat() -> None:
+def test_grid_allows_price_with_stat_cost_for_external_stat() -> None:
     """Test that grid schema allows price when stat_cost is set for external stats."""
     result = ENERGY_SOURCE_SCHEMA(
         [
@@ -1120,7 +1038,7 @@ async def test_grid_allows_price_with_stat_cost_for_external_stat() -> None:
     assert result[0]["entity_energy_price"] == "input_number.electricity_rate"
 
 
-async def test_gas_allows_price_with_stat_cost_for_external_stat() -> None:
+def test_gas_allows_price_with_stat_cost_for_external_stat() -> None:
     """Test that gas schema allows price when stat_cost is set for external stats."""
     result = GAS_SOURCE_SCHEMA(
         {
@@ -1134,7 +1052,7 @@ async def test_gas_allows_price_with_stat_cost_for_external_stat() -> None:
     assert result["entity_energy_price"] == "sensor.gas_price"
 
 
-async def test_water_allows_price_with_stat_cost_for_external_stat() -> None:
+def test_water_allows_price_with_stat_cost_for_external_stat() -> None:
     """Test that water schema allows price when stat_cost is set for external stats."""
     result = WATER_SOURCE_SCHEMA(
         {
@@ -3,51 +3,61 @@
 import pytest
 
 from homeassistant.components.energy import validate
-from homeassistant.components.energy.data import EnergyManager
 from homeassistant.const import UnitOfVolumeFlowRate
 from homeassistant.core import HomeAssistant
 
 FLOW_RATE_UNITS_STRING = ", ".join(tuple(UnitOfVolumeFlowRate))
-
-
-@pytest.fixture(autouse=True)
-async def setup_energy_for_validation(
-    mock_energy_manager: EnergyManager,
-) -> EnergyManager:
-    """Ensure energy manager is set up for validation tests."""
-    return mock_energy_manager
-
-
-async def test_validation_gas_flow_rate_valid(
-    hass: HomeAssistant, mock_energy_manager, mock_get_metadata
+CONSUMPTION_ATTRIBUTES = {
+    source_type: {
+        "device_class": source_type,
+        "unit_of_measurement": "m³",
+        "state_class": "total_increasing",
+    }
+    for source_type in ("gas", "water")
+}
+
+
+@pytest.fixture
+def consumption_sensor(hass: HomeAssistant, source_type: str) -> str:
+    """Set up a valid consumption sensor for the parametrized source type."""
+    entity_id = f"sensor.{source_type}_consumption"
+    hass.states.async_set(entity_id, "10.10", CONSUMPTION_ATTRIBUTES[source_type])
+    return entity_id
+
+
+@pytest.mark.parametrize(
+    ("source_type", "flow_rate_unit"),
+    [
+        ("gas", UnitOfVolumeFlowRate.CUBIC_METERS_PER_HOUR),
+        ("water", UnitOfVolumeFlowRate.LITERS_PER_MINUTE),
+    ],
+)
+async def test_validation_flow_rate_valid(
+    hass: HomeAssistant,
+    mock_energy_manager,
+    mock_get_metadata,
+    consumption_sensor: str,
+    source_type: str,
+    flow_rate_unit: UnitOfVolumeFlowRate,
 ) -> None:
-    """Test validating gas with valid flow rate sensor."""
+    """Test validating gas/water with valid flow rate sensor."""
     await mock_energy_manager.async_update(
         {
             "energy_sources": [
                 {
-                    "type": "gas",
-                    "stat_energy_from": "sensor.gas_consumption",
-                    "stat_rate": "sensor.gas_flow_rate",
+                    "type": source_type,
+                    "stat_energy_from": consumption_sensor,
+                    "stat_rate": f"sensor.{source_type}_flow_rate",
                 }
             ]
         }
     )
     hass.states.async_set(
-        "sensor.gas_consumption",
-        "10.10",
-        {
-            "device_class": "gas",
-            "unit_of_measurement": "m³",
-            "state_class": "total_increasing",
-        },
-    )
-    hass.states.async_set(
-        "sensor.gas_flow_rate",
+        f"sensor.{source_type}_flow_rate",
         "1.5",
         {
             "device_class": "volume_flow_rate",
-            "unit_of_measurement": UnitOfVolumeFlowRate.CUBIC_METERS_PER_HOUR,
+            "unit_of_measurement": flow_rate_unit,
             "state_class": "measurement",
         },
     )
@@ -60,32 +70,28 @@ async def test_validation_gas_flow_rate_valid(
     }
 
 
-async def test_validation_gas_flow_rate_wrong_unit(
-    hass: HomeAssistant, mock_energy_manager, mock_get_metadata
+@pytest.mark.parametrize("source_type", ["gas", "water"])
+async def test_validation_flow_rate_wrong_unit(
+    hass: HomeAssistant,
+    mock_energy_manager,
+    mock_get_metadata,
+    consumption_sensor: str,
+    source_type: str,
 ) -> None:
-    """Test validating gas with flow rate sensor having wrong unit."""
+    """Test validating gas/water with flow rate sensor having wrong unit."""
     await mock_energy_manager.async_update(
         {
             "energy_sources": [
                 {
-                    "type": "gas",
-                    "stat_energy_from": "sensor.gas_consumption",
-                    "stat_rate": "sensor.gas_flow_rate",
+                    "type": source_type,
+                    "stat_energy_from": consumption_sensor,
+                    "stat_rate": f"sensor.{source_type}_flow_rate",
                 }
             ]
         }
     )
     hass.states.async_set(
-        "sensor.gas_consumption",
-        "10.10",
-        {
-            "device_class": "gas",
-            "unit_of_measurement": "m³",
-            "state_class": "total_increasing",
-        },
-    )
-    hass.states.async_set(
-        "sensor.gas_flow_rate",
+        f"sensor.{source_type}_flow_rate",
         "1.5",
         {
             "device_class": "volume_flow_rate",
@@ -100,7 +106,7 @@ async def test_validation_gas_flow_rate_wrong_unit(
             [
                 {
                     "type": "entity_unexpected_unit_volume_flow_rate",
-                    "affected_entities": {("sensor.gas_flow_rate", "beers")},
+                    "affected_entities": {(f"sensor.{source_type}_flow_rate", "beers")},
                     "translation_placeholders": {
                         "flow_rate_units": FLOW_RATE_UNITS_STRING
                     },
@@ -112,259 +118,39 @@ async def test_validation_gas_flow_rate_wrong_unit(
     }
 
 
-async def test_validation_gas_flow_rate_wrong_state_class(
-    hass: HomeAssistant, mock_energy_manager, mock_get_metadata
+@pytest.mark.parametrize(
+    ("source_type", "flow_rate_unit"),
+    [
+        ("gas", UnitOfVolumeFlowRate.CUBIC_METERS_PER_HOUR),
+        ("water", UnitOfVolumeFlowRate.LITERS_PER_MINUTE),
+    ],
+)
+async def test_validation_flow_rate_wrong_state_class(
+    hass: HomeAssistant,
+    mock_energy_manager,
+    mock_get_metadata,
+    consumption_sensor: str,
+    source_type: str,
+    flow_rate_unit: UnitOfVolumeFlowRate,
 ) -> None:
-    """Test validating gas with flow rate sensor having wrong state class."""
+    """Test validating gas/water with flow rate sensor having wrong state class."""
     await mock_energy_manager.async_update(
         {
             "energy_sources": [
                 {
-                    "type": "gas",
-                    "stat_energy_from": "sensor.gas_consumption",
-                    "stat_rate": "sensor.gas_flow_rate",
+                    "type": source_type,
+                    "stat_energy_from": consumption_sensor,
+                    "stat_rate": f"sensor.{source_type}_flow_rate",
                 }
             ]
         }
     )
     hass.states.async_set(
-        "sensor.gas_consumption",
-        "10.10",
-        {
-            "device_class": "gas",
-            "unit_of_measurement": "m³",
-            "state_class": "total_increasing",
-        },
-    )
-    hass.states.async_set(
-        "sensor.gas_flow_rate",
+        f"sensor.{source_type}_flow_rate",
         "1.5",
         {
             "device_class": "volume_flow_rate",
-            "unit_of_measurement": UnitOfVolumeFlowRate.CUBIC_METERS_PER_HOUR,
-            "state_class": "total_increasing",
-        },
-    )
-
-    result = await validate.async_validate(hass)
-    assert result.as_dict() == {
-        "energy_sources": [
-            [
-                {
-                    "type": "entity_unexpected_state_class",
-                    "affected_entities": {("sensor.gas_flow_rate", "total_increasing")},
-                    "translation_placeholders": None,
-                }
-            ]
-        ],
-        "device_consumption": [],
-        "device_consumption_water": [],
-    }
-
-
-async def test_validation_gas_flow_rate_entity_missing(
-    hass: HomeAssistant, mock_energy_manager, mock_get_metadata
-) -> None:
-    """Test validating gas with missing flow rate sensor."""
-    mock_get_metadata["sensor.missing_flow_rate"] = None
-    await mock_energy_manager.async_update(
-        {
-            "energy_sources": [
-                {
-                    "type": "gas",
-                    "stat_energy_from": "sensor.gas_consumption",
-                    "stat_rate": "sensor.missing_flow_rate",
-                }
-            ]
-        }
-    )
-    hass.states.async_set(
-        "sensor.gas_consumption",
-        "10.10",
-        {
-            "device_class": "gas",
-            "unit_of_measurement": "m³",
-            "state_class": "total_increasing",
-        },
-    )
-
-    result = await validate.async_validate(hass)
-    assert result.as_dict() == {
-        "energy_sources": [
-            [
-                {
-                    "type": "statistics_not_defined",
-                    "affected_entities": {("sensor.missing_flow_rate", None)},
-                    "translation_placeholders": None,
-                },
-                {
-                    "type": "entity_not_defined",
-                    "affected_entities": {("sensor.missing_flow_rate", None)},
-                    "translation_placeholders": None,
-                },
-            ]
-        ],
-        "device_consumption": [],
-        "device_consumption_water": [],
-    }
-
-
-async def test_validation_gas_without_flow_rate(
-    hass: HomeAssistant, mock_energy_manager, mock_get_metadata
-) -> None:
-    """Test validating gas without flow rate sensor still works."""
-    await mock_energy_manager.async_update(
-        {
-            "energy_sources": [
-                {
-                    "type": "gas",
-                    "stat_energy_from": "sensor.gas_consumption",
-                }
-            ]
-        }
-    )
-    hass.states.async_set(
-        "sensor.gas_consumption",
-        "10.10",
-        {
-            "device_class": "gas",
-            "unit_of_measurement": "m³",
-            "state_class": "total_increasing",
-        },
-    )
-
-    result = await validate.async_validate(hass)
-    assert result.as_dict() == {
-        "energy_sources": [[]],
-        "device_consumption": [],
-        "device_consumption_water": [],
-    }
-
-
-async def test_validation_water_flow_rate_valid(
-    hass: HomeAssistant, mock_energy_manager, mock_get_metadata
-) -> None:
-    """Test validating water with valid flow rate sensor."""
-    await mock_energy_manager.async_update(
-        {
-            "energy_sources": [
-                {
-                    "type": "water",
-                    "stat_energy_from": "sensor.water_consumption",
-                    "stat_rate": "sensor.water_flow_rate",
-                }
-            ]
-        }
-    )
-    hass.states.async_set(
-        "sensor.water_consumption",
-        "10.10",
-        {
-            "device_class": "water",
-            "unit_of_measurement": "m³",
-            "state_class": "total_increasing",
-        },
-    )
-    hass.states.async_set(
-        "sensor.water_flow_rate",
-        "2.5",
-        {
-            "device_class": "volume_flow_rate",
-            "unit_of_measurement": UnitOfVolumeFlowRate.LITERS_PER_MINUTE,
-            "state_class": "measurement",
-        },
-    )
-
-    result = await validate.async_validate(hass)
-    assert result.as_dict() == {
-        "energy_sources": [[]],
-        "device_consumption": [],
-        "device_consumption_water": [],
-    }
-
-
-async def test_validation_water_flow_rate_wrong_unit(
-    hass: HomeAssistant, mock_energy_manager, mock_get_metadata
-) -> None:
-    """Test validating water with flow rate sensor having wrong unit."""
-    await mock_energy_manager.async_update(
-        {
-            "energy_sources": [
-                {
-                    "type": "water",
-                    "stat_energy_from": "sensor.water_consumption",
-                    "stat_rate": "sensor.water_flow_rate",
-                }
-            ]
-        }
-    )
-    hass.states.async_set(
-        "sensor.water_consumption",
-        "10.10",
-        {
-            "device_class": "water",
-            "unit_of_measurement": "m³",
-            "state_class": "total_increasing",
-        },
-    )
-    hass.states.async_set(
-        "sensor.water_flow_rate",
-        "2.5",
-        {
-            "device_class": "volume_flow_rate",
-            "unit_of_measurement": "beers",
-            "state_class": "measurement",
-        },
-    )
-
-    result = await validate.async_validate(hass)
-    assert result.as_dict() == {
-        "energy_sources": [
-            [
-                {
-                    "type": "entity_unexpected_unit_volume_flow_rate",
-                    "affected_entities": {("sensor.water_flow_rate", "beers")},
-                    "translation_placeholders": {
-                        "flow_rate_units": FLOW_RATE_UNITS_STRING
-                    },
-                }
-            ]
-        ],
-        "device_consumption": [],
-        "device_consumption_water": [],
-    }
-
-
-async def test_validation_water_flow_rate_wrong_state_class(
-    hass: HomeAssistant, mock_energy_manager, mock_get_metadata
-) -> None:
-    """Test validating water with flow rate sensor having wrong state class."""
-    await mock_energy_manager.async_update(
-        {
-            "energy_sources": [
-                {
-                    "type": "water",
-                    "stat_energy_from": "sensor.water_consumption",
-                    "stat_rate": "sensor.water_flow_rate",
-                }
-            ]
-        }
-    )
-    hass.states.async_set(
-        "sensor.water_consumption",
-        "10.10",
-        {
-            "device_class": "water",
-            "unit_of_measurement": "m³",
-            "state_class": "total_increasing",
-        },
-    )
-    hass.states.async_set(
-        "sensor.water_flow_rate",
-        "2.5",
-        {
-            "device_class": "volume_flow_rate",
-            "unit_of_measurement": UnitOfVolumeFlowRate.LITERS_PER_MINUTE,
+            "unit_of_measurement": flow_rate_unit,
             "state_class": "total_increasing",
         },
     )
@@ -376,7 +162,7 @@ async def test_validation_water_flow_rate_wrong_state_class(
                 {
                     "type": "entity_unexpected_state_class",
                     "affected_entities": {
-                        ("sensor.water_flow_rate", "total_increasing")
+                        (f"sensor.{source_type}_flow_rate", "total_increasing")
                     },
                     "translation_placeholders": None,
                 }
@@ -387,31 +173,27 @@ async def test_validation_water_flow_rate_wrong_state_class(
     }
 
 
-async def test_validation_water_flow_rate_entity_missing(
-    hass: HomeAssistant, mock_energy_manager, mock_get_metadata
+@pytest.mark.parametrize("source_type", ["gas", "water"])
+async def test_validation_flow_rate_entity_missing(
+    hass: HomeAssistant,
+    mock_energy_manager,
+    mock_get_metadata,
+    consumption_sensor: str,
+    source_type: str,
 ) -> None:
-    """Test validating water with missing flow rate sensor."""
+    """Test validating gas/water with missing flow rate sensor."""
     mock_get_metadata["sensor.missing_flow_rate"] = None
     await mock_energy_manager.async_update(
         {
             "energy_sources": [
                 {
-                    "type": "water",
-                    "stat_energy_from": "sensor.water_consumption",
+                    "type": source_type,
+                    "stat_energy_from": consumption_sensor,
                     "stat_rate": "sensor.missing_flow_rate",
                 }
             ]
         }
     )
-    hass.states.async_set(
-        "sensor.water_consumption",
-        "10.10",
-        {
-            "device_class": "water",
-            "unit_of_measurement": "m³",
-            "state_class": "total_increasing",
-        },
-    )
 
     result = await validate.async_validate(hass)
     assert result.as_dict() == {
@@ -434,29 +216,25 @@ async def test_validation_water_flow_rate_entity_missing(
     }
 
 
-async def test_validation_water_without_flow_rate(
-    hass: HomeAssistant, mock_energy_manager, mock_get_metadata
+@pytest.mark.parametrize("source_type", ["gas", "water"])
+async def test_validation_without_flow_rate(
+    hass: HomeAssistant,
+    mock_energy_manager,
+    mock_get_metadata,
+    consumption_sensor: str,
+    source_type: str,
 ) -> None:
-    """Test validating water without flow rate sensor still works."""
+    """Test validating gas/water without flow rate sensor still works."""
     await mock_energy_manager.async_update(
         {
             "energy_sources": [
                 {
-                    "type": "water",
-                    "stat_energy_from": "sensor.water_consumption",
+                    "type": source_type,
+                    "stat_energy_from": consumption_sensor,
                 }
             ]
         }
     )
-    hass.states.async_set(
-        "sensor.water_consumption",
-        "10.10",
-        {
-            "device_class": "water",
-            "unit_of_measurement": "m³",
-            "state_class": "total_increasing",
-        },
-    )
 
     result = await validate.async_validate(hass)
     assert result.as_dict() == {
@@ -487,22 +265,10 @@ async def test_validation_gas_flow_rate_different_units(
         }
     )
     hass.states.async_set(
-        "sensor.gas_consumption_1",
-        "10.10",
-        {
-            "device_class": "gas",
-            "unit_of_measurement": "m³",
-            "state_class": "total_increasing",
-        },
+        "sensor.gas_consumption_1", "10.10", CONSUMPTION_ATTRIBUTES["gas"]
     )
     hass.states.async_set(
-        "sensor.gas_consumption_2",
-        "20.20",
-        {
-            "device_class": "gas",
-            "unit_of_measurement": "m³",
-            "state_class": "total_increasing",
-        },
+        "sensor.gas_consumption_2", "20.20", CONSUMPTION_ATTRIBUTES["gas"]
     )
     hass.states.async_set(
         "sensor.gas_flow_m3h",
@@ -531,75 +297,35 @@ async def test_validation_gas_flow_rate_different_units(
     }
 
 
-async def test_validation_gas_flow_rate_recorder_untracked(
-    hass: HomeAssistant, mock_energy_manager, mock_is_entity_recorded, mock_get_metadata
-) -> None:
-    """Test validating gas with flow rate sensor not tracked by recorder."""
-    mock_is_entity_recorded["sensor.untracked_flow_rate"] = False
-
-    await mock_energy_manager.async_update(
-        {
-            "energy_sources": [
-                {
-                    "type": "gas",
-                    "stat_energy_from": "sensor.gas_consumption",
-                    "stat_rate": "sensor.untracked_flow_rate",
-                }
-            ]
-        }
-    )
-    hass.states.async_set(
-        "sensor.gas_consumption",
-        "10.10",
-        {
-            "device_class": "gas",
-            "unit_of_measurement": "m³",
-            "state_class": "total_increasing",
-        },
-    )
-
-    result = await validate.async_validate(hass)
-    assert result.as_dict() == {
-        "energy_sources": [
-            [
-                {
-                    "type": "recorder_untracked",
-                    "affected_entities": {("sensor.untracked_flow_rate", None)},
-                    "translation_placeholders": None,
-                }
-            ]
-        ],
-        "device_consumption": [],
-        "device_consumption_water": [],
-    }
+@pytest.fixture
+def untracked_flow_rate(mock_is_entity_recorded: dict[str, bool]) -> str:
+    """Return a flow rate sensor that is not tracked by the recorder."""
+    entity_id = "sensor.untracked_flow_rate"
+    mock_is_entity_recorded[entity_id] = False
+    return entity_id
 
 
-async def test_validation_water_flow_rate_recorder_untracked(
-    hass: HomeAssistant, mock_energy_manager, mock_is_entity_recorded, mock_get_metadata
+@pytest.mark.parametrize("source_type", ["gas", "water"])
+async def test_validation_flow_rate_recorder_untracked(
+    hass: HomeAssistant,
+    mock_energy_manager,
+    mock_get_metadata,
+    consumption_sensor: str,
+    untracked_flow_rate: str,
+    source_type: str,
 ) -> None:
-    """Test validating water with flow rate sensor not tracked by recorder."""
-    mock_is_entity_recorded["sensor.untracked_flow_rate"] = False
-
+    """Test validating gas/water with flow rate sensor not tracked by recorder."""
     await mock_energy_manager.async_update(
         {
             "energy_sources": [
                 {
-                    "type": "water",
-                    "stat_energy_from": "sensor.water_consumption",
-                    "stat_rate": "sensor.untracked_flow_rate",
+                    "type": source_type,
+                    "stat_energy_from": consumption_sensor,
+                    "stat_rate": untracked_flow_rate,
                 }
             ]
         }
     )
-    hass.states.async_set(
-        "sensor.water_consumption",
-        "10.10",
-        {
-            "device_class": "water",
-            "unit_of_measurement": "m³",
-            "state_class": "total_increasing",
-        },
-    )
 
     result = await validate.async_validate(hass)
     assert result.as_dict() == {
@@ -607,7 +333,7 @@ async def test_validation_water_flow_rate_recorder_untracked(
             [
                 {
                     "type": "recorder_untracked",
-                    "affected_entities": {("sensor.untracked_flow_rate", None)},
+                    "affected_entities": {(untracked_flow_rate, None)},
                     "translation_placeholders": None,
                 }
             ]
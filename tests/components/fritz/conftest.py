@@ -10,7 +10,9 @@ from fritzconnection.lib.fritzhosts import FritzHosts
 from fritzconnection.lib.fritzstatus import FritzStatus
 import pytest
 
+from homeassistant.components.fritz.const import DOMAIN
 from homeassistant.components.fritz.coordinator import FritzConnectionCached
+from homeassistant.core import HomeAssistant
 
 from .const import (
     MOCK_FB_SERVICES,
@@ -18,8 +20,11 @@ from .const import (
     MOCK_MESH_DATA,
     MOCK_MODELNAME,
     MOCK_STATUS_CONNECTION_DATA,
+    MOCK_USER_DATA,
 )
 
+from tests.common import MockConfigEntry
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -113,6 +118,14 @@ def wifi_services_with_ssids(ssid_1: str, ssid_2: str) -> dict[str, dict[str, An
     return services
 
 
+@pytest.fixture
+def mock_entry(hass: HomeAssistant) -> MockConfigEntry:
+    """Return a Fritz!Tools config entry added to hass."""
+    entry = MockConfigEntry(domain=DOMAIN, data=MOCK_USER_DATA)
+    entry.add_to_hass(hass)
+    return entry
+
+
 @pytest.fixture(name="fc_data")
 def fc_data_mock() -> dict[str, dict[str, Any]]:
     """Fixture for default fc_data."""
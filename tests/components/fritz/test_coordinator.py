@@ -1,8 +1,7 @@
 """Tests for Fritz!Tools coordinator."""
 
 from collections.abc import Generator
-from copy import deepcopy
-from typing import cast
+from typing import Any, cast
 from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 
 from freezegun.api import FrozenDateTimeFactory
@@ -54,6 +53,13 @@ from .const import (
 from tests.common import MockConfigEntry, async_fire_time_changed
 
 
+def _device_info_with(overrides: dict[str, Any]) -> MagicMock:
+    """Return a get_device_info mock with overridden device info fields."""
+    return MagicMock(
+        return_value=ArgumentNamespace({**MOCK_STATUS_DEVICE_INFO_DATA, **overrides})
+    )
+
+
 @pytest.fixture(name="mock_config_entry")
 def fixture_mock_config_entry() -> MockConfigEntry:
     """Return a mock config entry with host, username, password, and port."""
@@ -110,16 +116,14 @@ async def fixture_fritz_tools(
 )
 async def test_fritzboxtools_class_no_setup(
     hass: HomeAssistant,
+    mock_entry: MockConfigEntry,
     attr: str,
 ) -> None:
     """Test accessing FritzBoxTools class properties before setup."""
 
-    entry = MockConfigEntry(domain=DOMAIN, data=MOCK_USER_DATA)
-    entry.add_to_hass(hass)
-
     coordinator = AvmWrapper(
         hass=hass,
-        config_entry=entry,
+        config_entry=mock_entry,
         host=MOCK_USER_DATA[CONF_HOST],
         port=MOCK_USER_DATA[CONF_PORT],
         username=MOCK_USER_DATA[CONF_USERNAME],
@@ -136,6 +140,7 @@ async def test_fritzboxtools_class_no_setup(
 
 async def test_clear_connection_cache(
     hass: HomeAssistant,
+    mock_entry: MockConfigEntry,
     caplog: pytest.LogCaptureFixture,
     fc_class_mock,
     fh_class_mock,
@@ -143,12 +148,9 @@ async def test_clear_connection_cache(
 ) -> None:
     """Test clearing the connection cache."""
 
-    entry = MockConfigEntry(domain=DOMAIN, data=MOCK_USER_DATA)
-    entry.add_to_hass(hass)
-
-    assert await hass.config_entries.async_setup(entry.entry_id)
+    assert await hass.config_entries.async_setup(mock_entry.entry_id)
     await hass.async_block_till_done(wait_background_tasks=True)
-    assert entry.state is ConfigEntryState.LOADED
+    assert mock_entry.state is ConfigEntryState.LOADED
 
     caplog.clear()
     fc_class_mock.return_value.clear_cache()
@@ -158,6 +160,7 @@ async def test_clear_connection_cache(
 
 async def test_no_connection(
     hass: HomeAssistant,
+    mock_entry: MockConfigEntry,
     caplog: pytest.LogCaptureFixture,
     fc_class_mock,
     fh_class_mock,
@@ -165,14 +168,11 @@ async def test_no_connection(
 ) -> None:
     """Test no connection established."""
 
-    entry = MockConfigEntry(domain=DOMAIN, data=MOCK_USER_DATA)
-    entry.add_to_hass(hass)
-
     with patch(
         "homeassistant.components.fritz.coordinator.FritzConnectionCached",
         return_value=None,
     ):
-        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.config_entries.async_setup(mock_entry.entry_id)
         await hass.async_block_till_done(wait_background_tasks=True)
 
         assert (
@@ -183,6 +183,7 @@ async def test_no_connection(
 
 async def test_no_software_version(
     hass: HomeAssistant,
+    mock_entry: MockConfigEntry,
     device_registry: dr.DeviceRegistry,
     fc_class_mock,
     fh_class_mock,
@@ -190,23 +191,18 @@ async def test_no_software_version(
 ) -> None:
     """Test software version non normalized."""
 
-    entry = MockConfigEntry(domain=DOMAIN, data=MOCK_USER_DATA)
-    entry.add_to_hass(hass)
-
-    device_info = deepcopy(MOCK_STATUS_DEVICE_INFO_DATA)
-    device_info["NewSoftwareVersion"] = "string_version_not_number"
     with patch.object(
         fs_class_mock,
         "get_device_info",
-        MagicMock(return_value=ArgumentNamespace(device_info)),
+        _device_info_with({"NewSoftwareVersion": "string_version_not_number"}),
     ):
-        assert await hass.config_entries.async_setup(entry.entry_id)
-        await hass.async_block_till_done(wait_background_tasks=True)
+        assert await hass.config_entries.async_setup(mock_entry.entry_id)
+        await hass.async_block_till_done()
 
-    assert entry.state is ConfigEntryState.LOADED
+    assert mock_entry.state is ConfigEntryState.LOADED
 
     device = device_registry.async_get_device_by_identifier(
-        (DOMAIN, MOCK_SERIAL_NUMBER), entry.entry_id
+        (DOMAIN, MOCK_SERIAL_NUMBER), mock_entry.entry_id
     )
     assert device
     assert device.sw_version == "string_version_not_number"
@@ -529,6 +525,7 @@ async def test_trigger_methods(
 
 async def test_avmwrapper_service_call_branches(
     hass: HomeAssistant,
+    mock_entry: MockConfigEntry,
     caplog: pytest.LogCaptureFixture,
     fc_class_mock,
     fh_class_mock,
@@ -536,12 +533,10 @@ async def test_avmwrapper_service_call_branches(
 ) -> None:
     """Test AvmWrapper service call return and exception branches."""
 
-    entry = MockConfigEntry(domain=DOMAIN, data=MOCK_USER_DATA)
-    entry.add_to_hass(hass)
-    assert await hass.config_entries.async_setup(entry.entry_id)
-    await hass.async_block_till_done(wait_background_tasks=True)
+    assert await hass.config_entries.async_setup(mock_entry.entry_id)
+    await hass.async_block_till_done()
 
-    wrapper = entry.runtime_data
+    wrapper = mock_entry.runtime_data
 
     wrapper.connection.services.pop("Hosts1", None)
     assert await wrapper._async_service_call("Hosts", "1", "GetInfo") == {}
@@ -565,18 +560,17 @@ async def test_avmwrapper_service_call_branches(
 
 async def test_avmwrapper_passthrough_methods(
     hass: HomeAssistant,
+    mock_entry: MockConfigEntry,
     fc_class_mock,
     fh_class_mock,
     fs_class_mock,
 ) -> None:
     """Test AvmWrapper helper methods and service wrappers."""
 
-    entry = MockConfigEntry(domain=DOMAIN, data=MOCK_USER_DATA)
-    entry.add_to_hass(hass)
-    assert await hass.config_entries.async_setup(entry.entry_id)
-    await hass.async_block_till_done(wait_background_tasks=True)
+    assert await hass.config_entries.async_setup(mock_entry.entry_id)
+    await hass.async_block_till_done()
 
-    wrapper = entry.runtime_data
+    wrapper = mock_entry.runtime_data
 
     wrapper.device_is_router = False
     assert await wrapper.async_ipv6_active() is False
@@ -595,6 +589,7 @@ async def test_avmwrapper_passthrough_methods(
 
 async def test_async_trigger_cleanup(
     hass: HomeAssistant,
+    mock_entry: MockConfigEntry,
     device_registry: dr.DeviceRegistry,
     entity_registry: er.EntityRegistry,
     freezer: FrozenDateTimeFactory,
@@ -609,15 +604,13 @@ async def test_async_trigger_cleanup(
         MOCK_HOST_FRITZBOX,
     ]
 
-    entry = MockConfigEntry(domain=DOMAIN, data=MOCK_USER_DATA)
-    entry.add_to_hass(hass)
-    assert await hass.config_entries.async_setup(entry.entry_id)
-    await hass.async_block_till_done(wait_background_tasks=True)
-    assert entry.state is ConfigEntryState.LOADED
+    assert await hass.config_entries.async_setup(mock_entry.entry_id)
+    await hass.async_block_till_done()
+    assert mock_entry.state is ConfigEntryState.LOADED
 
     # Verify the printer is registered as tracked device
     assert device_registry.async_get_device_by_connection(
-        (dr.CONNECTION_NETWORK_MAC, "aa:bb:cc:00:11:22"), entry.entry_id
+        (dr.CONNECTION_NETWORK_MAC, "aa:bb:cc:00:11:22"), mock_entry.entry_id
     )
     assert entity_registry.async_get("device_tracker.printer")
     assert entity_registry.async_get("switch.printer_internet_access")
@@ -632,7 +625,7 @@ async def test_async_trigger_cleanup(
     # Verify the printer was removed from tracked devices
     assert (
         device_registry.async_get_device_by_connection(
-            (dr.CONNECTION_NETWORK_MAC, "aa:bb:cc:00:11:22"), entry.entry_id
+            (dr.CONNECTION_NETWORK_MAC, "aa:bb:cc:00:11:22"), mock_entry.entry_id
         )
         is None
     )
@@ -651,7 +644,7 @@ async def test_async_trigger_cleanup(
 
     # Verify the printer is registered again as tracked device
     assert device_registry.async_get_device_by_connection(
-        (dr.CONNECTION_NETWORK_MAC, "aa:bb:cc:00:11:22"), entry.entry_id
+        (dr.CONNECTION_NETWORK_MAC, "aa:bb:cc:00:11:22"), mock_entry.entry_id
     )
     assert entity_registry.async_get("device_tracker.printer")
     assert entity_registry.async_get("switch.printer_internet_access")
@@ -659,23 +652,22 @@ async def test_async_trigger_cleanup(
 
 async def test_async_trigger_cleanup_preserves_fritz_device(
     hass: HomeAssistant,
+    mock_entry: MockConfigEntry,
     device_registry: dr.DeviceRegistry,
     fc_class_mock,
     fh_class_mock,
     fs_class_mock,
 ) -> None:
     """Test that cleanup does not remove the fritz box device itself."""
-    entry = MockConfigEntry(domain=DOMAIN, data=MOCK_USER_DATA)
-    entry.add_to_hass(hass)
-    assert await hass.config_entries.async_setup(entry.entry_id)
-    await hass.async_block_till_done(wait_background_tasks=True)
-    assert entry.state is ConfigEntryState.LOADED
+    assert await hass.config_entries.async_setup(mock_entry.entry_id)
+    await hass.async_block_till_done()
+    assert mock_entry.state is ConfigEntryState.LOADED
 
-    wrapper: AvmWrapper = entry.runtime_data
+    wrapper: AvmWrapper = mock_entry.runtime_data
 
     # Verify the fritz box device was registered
     fritz_device = device_registry.async_get_device_by_identifier(
-        (DOMAIN, MOCK_SERIAL_NUMBER), entry.entry_id
+        (DOMAIN, MOCK_SERIAL_NUMBER), mock_entry.entry_id
     )
     assert fritz_device is not None
 
@@ -692,7 +684,7 @@ async def test_async_trigger_cleanup_preserves_fritz_device(
 
     # The fritz box device must still be present in the registry
     fritz_device_after = device_registry.async_get_device_by_identifier(
-        (DOMAIN, MOCK_SERIAL_NUMBER), entry.entry_id
+        (DOMAIN, MOCK_SERIAL_NUMBER), mock_entry.entry_id
     )
     assert fritz_device_after is not None
     assert fritz_device_after.id == fritz_device.id
@@ -720,7 +712,7 @@ async def test_old_discovery_does_not_self_reference_box(
     entry.add_to_hass(hass)
 
     assert await hass.config_entries.async_setup(entry.entry_id)
-    await hass.async_block_till_done(wait_background_tasks=True)
+    await hass.async_block_till_done()
 
     assert entry.state is ConfigEntryState.LOADED
 
@@ -28,21 +28,19 @@ from tests.common import MockConfigEntry, async_fire_time_changed
 
 async def test_setup(
     hass: HomeAssistant,
+    mock_entry: MockConfigEntry,
     fc_class_mock,
     fh_class_mock,
     fs_class_mock,
 ) -> None:
     """Test setup and unload of Fritz!Tools."""
 
-    entry = MockConfigEntry(domain=DOMAIN, data=MOCK_USER_DATA)
-    entry.add_to_hass(hass)
-
-    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.config_entries.async_setup(mock_entry.entry_id)
     await hass.async_block_till_done()
-    assert entry.state is ConfigEntryState.LOADED
+    assert mock_entry.state is ConfigEntryState.LOADED
 
-    await hass.config_entries.async_unload(entry.entry_id)
-    assert entry.state is ConfigEntryState.NOT_LOADED
+    await hass.config_entries.async_unload(mock_entry.entry_id)
+    assert mock_entry.state is ConfigEntryState.NOT_LOADED
 
 
 async def test_options_reload(
@@ -78,93 +76,78 @@ async def test_options_reload(
 
 
 @pytest.mark.parametrize(
-    "error",
-    FRITZ_AUTH_EXCEPTIONS,
-)
-async def test_setup_auth_fail(hass: HomeAssistant, error) -> None:
-    """Test starting a flow by user with an already configured device."""
-
-    entry = MockConfigEntry(domain=DOMAIN, data=MOCK_USER_DATA)
-    entry.add_to_hass(hass)
-
-    with patch(
-        "homeassistant.components.fritz.coordinator.FritzConnectionCached",
-        side_effect=error,
-    ):
-        await hass.config_entries.async_setup(entry.entry_id)
-        await hass.async_block_till_done()
-
-    assert entry.state is ConfigEntryState.SETUP_ERROR
-
-
-@pytest.mark.parametrize(
-    "error",
-    FRITZ_EXCEPTIONS,
+    ("error", "expected_state", "expected_translation_key"),
+    [(error, ConfigEntryState.SETUP_ERROR, None) for error in FRITZ_AUTH_EXCEPTIONS]
+    + [
+        (error, ConfigEntryState.SETUP_RETRY, "error_connecting")
+        for error in FRITZ_EXCEPTIONS
+    ],
 )
-async def test_setup_fail(hass: HomeAssistant, error) -> None:
-    """Test starting a flow by user with an already configured device."""
-
-    entry = MockConfigEntry(domain=DOMAIN, data=MOCK_USER_DATA)
-    entry.add_to_hass(hass)
+async def test_setup_fail(
+    hass: HomeAssistant,
+    mock_entry: MockConfigEntry,
+    fc_class_mock,
+    error: Exception,
+    expected_state: ConfigEntryState,
+    expected_translation_key: str | None,
+) -> None:
+    """Test setup failing on authentication and connection errors."""
 
-    with patch(
-        "homeassistant.components.fritz.coordinator.FritzConnectionCached",
-        side_effect=error,
-    ):
-        await hass.config_entries.async_setup(entry.entry_id)
-        await hass.async_block_till_done()
+    fc_class_mock.side_effect = error
+    await hass.config_entries.async_setup(mock_entry.entry_id)
+    await hass.async_block_till_done()
 
-    assert entry.state is ConfigEntryState.SETUP_RETRY
-    assert entry.state.recoverable is True
-    assert entry.error_reason_translation_key == "error_connecting"
+    assert mock_entry.state is expected_state
+    assert mock_entry.state.recoverable is (
+        expected_state is ConfigEntryState.SETUP_RETRY
+    )
+    assert mock_entry.error_reason_translation_key == expected_translation_key
 
 
-async def test_setup_fail_parse_error(hass: HomeAssistant, fc_class_mock) -> None:
+async def test_setup_fail_parse_error(
+    hass: HomeAssistant, mock_entry: MockConfigEntry, fc_class_mock
+) -> None:
     """Test setup failure due to parse error while fetching device data."""
 
-    entry = MockConfigEntry(domain=DOMAIN, data=MOCK_USER_DATA)
-    entry.add_to_hass(hass)
-
     with (
         patch(
             "homeassistant.components.fritz.coordinator.FritzStatus.get_device_info"
         ) as fs_mock,
     ):
         fs_mock.side_effect = ParseError("boom")
-        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.config_entries.async_setup(mock_entry.entry_id)
         await hass.async_block_till_done()
 
-    assert entry.state is ConfigEntryState.SETUP_RETRY
-    assert entry.error_reason_translation_key == "error_parse_device_info"
+    assert mock_entry.state is ConfigEntryState.SETUP_RETRY
+    assert mock_entry.error_reason_translation_key == "error_parse_device_info"
 
 
 async def test_upnp_missing(
     hass: HomeAssistant,
+    mock_entry: MockConfigEntry,
     fc_class_mock,
     fh_class_mock,
     fs_class_mock,
 ) -> None:
     """Test UPNP configuration is missing."""
 
-    entry = MockConfigEntry(domain=DOMAIN, data=MOCK_USER_DATA)
-    entry.add_to_hass(hass)
-
     with (
         patch(
             "homeassistant.components.fritz.coordinator.AvmWrapper.async_get_upnp_configuration",
             return_value={"NewEnable": False},
         ),
     ):
-        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.config_entries.async_setup(mock_entry.entry_id)
         await hass.async_block_till_done()
 
-    assert entry.state is ConfigEntryState.SETUP_RETRY
-    assert entry.state.recoverable is True
-    assert entry.error_reason_translation_key == "error_upnp_disabled"
+    assert mock_entry.state is ConfigEntryState.SETUP_RETRY
+    assert mock_entry.state.recoverable is True
+    assert mock_entry.error_reason_translation_key == "error_upnp_disabled"
 
 
 async def test_execute_action_while_shutdown(
     hass: HomeAssistant,
+    mock_entry: MockConfigEntry,
     freezer: FrozenDateTimeFactory,
     caplog: pytest.LogCaptureFixture,
     fc_class_mock,
@@ -173,12 +156,9 @@ async def test_execute_action_while_shutdown(
 ) -> None:
     """Test Fritz!Tools actions executed during shutdown of HomeAssistant."""
 
-    entry = MockConfigEntry(domain=DOMAIN, data=MOCK_USER_DATA)
-    entry.add_to_hass(hass)
-
-    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.config_entries.async_setup(mock_entry.entry_id)
     await hass.async_block_till_done()
-    assert entry.state is ConfigEntryState.LOADED
+    assert mock_entry.state is ConfigEntryState.LOADED
 
     hass.set_state(core.CoreState.stopping)
     freezer.tick(SCAN_INTERVAL)
@@ -9,13 +9,13 @@ import pytest
 from requests.exceptions import RequestException
 from syrupy.assertion import SnapshotAssertion
 
-from homeassistant.components.fritz.const import DOMAIN, SCAN_INTERVAL
+from homeassistant.components.fritz.const import SCAN_INTERVAL
 from homeassistant.components.sensor import DOMAIN as SENSOR_DOMAIN
 from homeassistant.const import STATE_UNAVAILABLE, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
 
-from .const import MOCK_FB_SERVICES, MOCK_USER_DATA
+from .const import MOCK_FB_SERVICES
 
 from tests.common import MockConfigEntry, async_fire_time_changed, snapshot_platform
 
@@ -24,6 +24,7 @@ from tests.common import MockConfigEntry, async_fire_time_changed, snapshot_plat
 @pytest.mark.usefixtures("entity_registry_enabled_by_default")
 async def test_sensor_setup(
     hass: HomeAssistant,
+    mock_entry: MockConfigEntry,
     entity_registry: er.EntityRegistry,
     fc_class_mock,
     fh_class_mock,
@@ -32,18 +33,16 @@ async def test_sensor_setup(
 ) -> None:
     """Test setup of Fritz!Tools sensors."""
 
-    entry = MockConfigEntry(domain=DOMAIN, data=MOCK_USER_DATA)
-    entry.add_to_hass(hass)
-
     with patch("homeassistant.components.fritz.PLATFORMS", [Platform.SENSOR]):
-        assert await hass.config_entries.async_setup(entry.entry_id)
+        assert await hass.config_entries.async_setup(mock_entry.entry_id)
         await hass.async_block_till_done()
 
-    await snapshot_platform(hass, entity_registry, snapshot, entry.entry_id)
+    await snapshot_platform(hass, entity_registry, snapshot, mock_entry.entry_id)
 
 
 async def test_sensor_update_fail(
     hass: HomeAssistant,
+    mock_entry: MockConfigEntry,
     caplog: pytest.LogCaptureFixture,
     freezer: FrozenDateTimeFactory,
     fc_class_mock,
@@ -52,10 +51,7 @@ async def test_sensor_update_fail(
 ) -> None:
     """Test failed update of Fritz!Tools sensors."""
 
-    entry = MockConfigEntry(domain=DOMAIN, data=MOCK_USER_DATA)
-    entry.add_to_hass(hass)
-
-    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.config_entries.async_setup(mock_entry.entry_id)
     await hass.async_block_till_done()
 
     fc_class_mock().call_action_side_effect(FritzConnectionException("Boom"))
@@ -74,6 +70,7 @@ async def test_sensor_update_fail(
 @pytest.mark.freeze_time("2026-02-14T09:30:00+00:00")
 async def test_sensor_uptime_spike(
     hass: HomeAssistant,
+    mock_entry: MockConfigEntry,
     caplog: pytest.LogCaptureFixture,
     freezer: FrozenDateTimeFactory,
     fc_class_mock,
@@ -84,10 +81,7 @@ async def test_sensor_uptime_spike(
 
     entity_id = "sensor.mock_title_uptime"
 
-    entry = MockConfigEntry(domain=DOMAIN, data=MOCK_USER_DATA)
-    entry.add_to_hass(hass)
-
-    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.config_entries.async_setup(mock_entry.entry_id)
     await hass.async_block_till_done()
 
     assert (state := hass.states.get(entity_id))
@@ -107,7 +101,7 @@ async def test_sensor_uptime_spike(
 
     freezer.tick(SCAN_INTERVAL)
     async_fire_time_changed(hass)
-    await hass.async_block_till_done()
+    await hass.async_block_till_done(wait_background_tasks=True)
 
     assert (new_state := hass.states.get(entity_id))
     assert new_state.state == "2026-01-16T06:00:21+00:00"
@@ -126,6 +120,7 @@ async def test_sensor_uptime_spike(
 )
 async def test_sensor_cpu_temp_not_supported(
     hass: HomeAssistant,
+    mock_entry: MockConfigEntry,
     entity_registry: er.EntityRegistry,
     side_effect,
     return_values,
@@ -136,9 +131,6 @@ async def test_sensor_cpu_temp_not_supported(
 ) -> None:
     """Test setup of Fritz!Tools sensors."""
 
-    entry = MockConfigEntry(domain=DOMAIN, data=MOCK_USER_DATA)
-    entry.add_to_hass(hass)
-
     with (
         patch("homeassistant.components.fritz.PLATFORMS", [Platform.SENSOR]),
         patch(
@@ -147,10 +139,10 @@ async def test_sensor_cpu_temp_not_supported(
     ):
         mock_status.get_cpu_temperatures.side_effect = side_effect
         mock_status.get_cpu_temperatures.return_value = return_values
-        assert await hass.config_entries.async_setup(entry.entry_id)
+        assert await hass.config_entries.async_setup(mock_entry.entry_id)
         await hass.async_block_till_done()
 
-        await snapshot_platform(hass, entity_registry, snapshot, entry.entry_id)
+        await snapshot_platform(hass, entity_registry, snapshot, mock_entry.entry_id)
         assert not entity_registry.async_is_registered(
             "sensor.mock_title_cpu_temperature"
         )
@@ -12,9 +12,23 @@ import pytest
 from homeassistant.components.google_travel_time.const import DEFAULT_NAME, DOMAIN
 from homeassistant.core import HomeAssistant
 
+from .const import DEFAULT_OPTIONS, MOCK_CONFIG
+
 from tests.common import MockConfigEntry
 
 
+@pytest.fixture
+def data() -> dict[str, Any]:
+    """Return the default config entry data."""
+    return MOCK_CONFIG
+
+
+@pytest.fixture
+def options() -> dict[str, Any]:
+    """Return the default config entry options."""
+    return DEFAULT_OPTIONS
+
+
 @pytest.fixture(name="mock_config")
 async def mock_config_fixture(
     hass: HomeAssistant, data: dict[str, Any], options: dict[str, Any]
@@ -33,7 +33,7 @@ from homeassistant.const import CONF_API_KEY, CONF_LANGUAGE, CONF_MODE
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResultType
 
-from .const import DEFAULT_OPTIONS, MOCK_CONFIG, RECONFIGURE_CONFIG
+from .const import MOCK_CONFIG, RECONFIGURE_CONFIG
 
 from tests.common import MockConfigEntry
 
@@ -136,10 +136,6 @@ async def test_errors(
     await assert_common_create_steps(hass, result)
 
 
-@pytest.mark.parametrize(
-    ("data", "options"),
-    [(MOCK_CONFIG, DEFAULT_OPTIONS)],
-)
 @pytest.mark.usefixtures("routes_mock", "mock_setup_entry")
 async def test_reconfigure(hass: HomeAssistant, mock_config: MockConfigEntry) -> None:
     """Test reconfigure flow."""
@@ -151,10 +147,6 @@ async def test_reconfigure(hass: HomeAssistant, mock_config: MockConfigEntry) ->
 
 
 @pytest.mark.usefixtures("mock_setup_entry")
-@pytest.mark.parametrize(
-    ("data", "options"),
-    [(MOCK_CONFIG, DEFAULT_OPTIONS)],
-)
 @pytest.mark.parametrize(
     ("exception", "error"),
     [
@@ -191,10 +183,6 @@ async def test_reconfigure_invalid_config_entry(
     await assert_common_reconfigure_steps(hass, result)
 
 
-@pytest.mark.parametrize(
-    ("data", "options"),
-    [(MOCK_CONFIG, DEFAULT_OPTIONS)],
-)
 @pytest.mark.usefixtures("routes_mock")
 async def test_options_flow(hass: HomeAssistant, mock_config: MockConfigEntry) -> None:
     """Test options flow."""
@@ -242,10 +230,6 @@ async def test_options_flow(hass: HomeAssistant, mock_config: MockConfigEntry) -
     }
 
 
-@pytest.mark.parametrize(
-    ("data", "options"),
-    [(MOCK_CONFIG, DEFAULT_OPTIONS)],
-)
 @pytest.mark.usefixtures("routes_mock")
 async def test_options_flow_departure_time(
     hass: HomeAssistant, mock_config: MockConfigEntry
@@ -439,10 +423,6 @@ async def test_reset_options_flow_fields(
     }
 
 
-@pytest.mark.parametrize(
-    ("data", "options"),
-    [(MOCK_CONFIG, DEFAULT_OPTIONS)],
-)
 @pytest.mark.usefixtures("routes_mock", "mock_setup_entry")
 async def test_dupe(hass: HomeAssistant, mock_config: MockConfigEntry) -> None:
     """Test setting up the same entry data twice is OK."""
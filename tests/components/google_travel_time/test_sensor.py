@@ -39,10 +39,6 @@ def mock_update_empty_fixture(routes_mock: AsyncMock) -> AsyncMock:
     return routes_mock
 
 
-@pytest.mark.parametrize(
-    ("data", "options"),
-    [(MOCK_CONFIG, DEFAULT_OPTIONS)],
-)
 @pytest.mark.usefixtures("routes_mock", "mock_config")
 async def test_sensor(hass: HomeAssistant) -> None:
     """Test that sensor works."""
@@ -94,10 +90,6 @@ async def test_sensor_name_from_entry_title(hass: HomeAssistant) -> None:
 
 
 @pytest.mark.usefixtures("mock_update_empty", "mock_config")
-@pytest.mark.parametrize(
-    ("data", "options"),
-    [(MOCK_CONFIG, DEFAULT_OPTIONS)],
-)
 async def test_sensor_empty_response(hass: HomeAssistant) -> None:
     """Test that sensor works for an empty response."""
     assert hass.states.get("sensor.google_travel_time").state == STATE_UNKNOWN
@@ -172,10 +164,6 @@ async def test_sensor_unit_system(
     assert routes_mock.compute_routes.call_args.args[0].units == expected_unit_option
 
 
-@pytest.mark.parametrize(
-    ("data", "options"),
-    [(MOCK_CONFIG, DEFAULT_OPTIONS)],
-)
 async def test_sensor_exception(
     hass: HomeAssistant,
     caplog: pytest.LogCaptureFixture,
@@ -192,10 +180,6 @@ async def test_sensor_exception(
     assert "Error getting travel time" in caplog.text
 
 
-@pytest.mark.parametrize(
-    ("data", "options"),
-    [(MOCK_CONFIG, DEFAULT_OPTIONS)],
-)
 async def test_sensor_routes_api_disabled(
     hass: HomeAssistant,
     caplog: pytest.LogCaptureFixture,
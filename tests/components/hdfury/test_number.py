@@ -102,22 +102,12 @@ async def test_number_error(
         )
 
 
-@pytest.mark.parametrize(
-    ("entity_id"),
-    [
-        ("number.hdfury_vrroom_02_oled_fade_timer"),
-        ("number.hdfury_vrroom_02_restart_timer"),
-        ("number.hdfury_vrroom_02_unmute_delay"),
-        ("number.hdfury_vrroom_02_earc_unmute_delay"),
-    ],
-)
 @pytest.mark.usefixtures("entity_registry_enabled_by_default")
 async def test_number_entities_unavailable_on_error(
     hass: HomeAssistant,
     mock_hdfury_client: AsyncMock,
     mock_config_entry: MockConfigEntry,
     freezer: FrozenDateTimeFactory,
-    entity_id: str,
 ) -> None:
     """Test API error causes entities to become unavailable."""
 
@@ -129,4 +119,10 @@ async def test_number_entities_unavailable_on_error(
     async_fire_time_changed(hass)
     await hass.async_block_till_done()
 
-    assert hass.states.get(entity_id).state == STATE_UNAVAILABLE
+    for entity_id in (
+        "number.hdfury_vrroom_02_oled_fade_timer",
+        "number.hdfury_vrroom_02_restart_timer",
+        "number.hdfury_vrroom_02_unmute_delay",
+        "number.hdfury_vrroom_02_earc_unmute_delay",
+    ):
+        assert hass.states.get(entity_id).state == STATE_UNAVAILABLE
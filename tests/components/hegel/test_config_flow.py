@@ -1,5 +1,6 @@
 """Test the Hegel config flow."""
 
+from dataclasses import replace
 from unittest.mock import MagicMock
 
 import pytest
@@ -17,6 +18,17 @@ from tests.common import MockConfigEntry
 
 TEST_NAME = "Hegel H190"
 TEST_SSDP_LOCATION = f"http://{TEST_HOST}:8080/description.xml"
+SSDP_DISCOVERY_INFO = SsdpServiceInfo(
+    ssdp_usn="mock_usn",
+    ssdp_st="mock_st",
+    ssdp_udn=TEST_UDN,
+    ssdp_location=TEST_SSDP_LOCATION,
+    upnp={
+        "presentationURL": f"http://{TEST_HOST}/",
+        "friendlyName": TEST_NAME,
+        "modelName": TEST_MODEL,
+    },
+)
 
 
 @pytest.mark.usefixtures("mock_setup_entry")
@@ -114,19 +126,7 @@ async def test_ssdp_discovery_success(
 ) -> None:
     """Test successful SSDP discovery."""
     result = await hass.config_entries.flow.async_init(
-        DOMAIN,
-        context={"source": SOURCE_SSDP},
-        data=SsdpServiceInfo(
-            ssdp_usn="mock_usn",
-            ssdp_st="mock_st",
-            ssdp_udn=TEST_UDN,
-            ssdp_location=TEST_SSDP_LOCATION,
-            upnp={
-                "presentationURL": f"http://{TEST_HOST}/",
-                "friendlyName": TEST_NAME,
-                "modelName": TEST_MODEL,
-            },
-        ),
+        DOMAIN, context={"source": SOURCE_SSDP}, data=SSDP_DISCOVERY_INFO
     )
 
     assert result["type"] is FlowResultType.FORM
@@ -150,11 +150,8 @@ async def test_ssdp_discovery_from_ssdp_location(
     result = await hass.config_entries.flow.async_init(
         DOMAIN,
         context={"source": SOURCE_SSDP},
-        data=SsdpServiceInfo(
-            ssdp_usn="mock_usn",
-            ssdp_st="mock_st",
-            ssdp_udn=TEST_UDN,
-            ssdp_location=TEST_SSDP_LOCATION,
+        data=replace(
+            SSDP_DISCOVERY_INFO,
             upnp={"friendlyName": TEST_NAME, "modelName": TEST_MODEL},
         ),
     )
@@ -171,38 +168,21 @@ async def test_ssdp_discovery_from_ssdp_location(
     assert result["data"] == {CONF_HOST: TEST_HOST, CONF_MODEL: TEST_MODEL}
 
 
-async def test_ssdp_discovery_no_host(hass: HomeAssistant) -> None:
-    """Test SSDP discovery aborts when no host can be determined."""
-    result = await hass.config_entries.flow.async_init(
-        DOMAIN,
-        context={"source": SOURCE_SSDP},
-        data=SsdpServiceInfo(
-            ssdp_usn="mock_usn",
-            ssdp_st="mock_st",
-            ssdp_udn=TEST_UDN,
-            ssdp_location="",
-            upnp={},
+@pytest.mark.parametrize(
+    "discovery_info",
+    [
+        pytest.param(
+            replace(SSDP_DISCOVERY_INFO, ssdp_location="", upnp={}), id="no_host"
         ),
-    )
-
-    assert result["type"] is FlowResultType.ABORT
-    assert result["reason"] == "no_host_found"
-
-
-async def test_ssdp_discovery_no_udn(hass: HomeAssistant) -> None:
-    """Test SSDP discovery aborts when no UDN is available."""
+        pytest.param(replace(SSDP_DISCOVERY_INFO, ssdp_udn=None), id="no_udn"),
+    ],
+)
+async def test_ssdp_discovery_no_host_found(
+    hass: HomeAssistant, discovery_info: SsdpServiceInfo
+) -> None:
+    """Test SSDP discovery aborts when no host or UDN can be determined."""
     result = await hass.config_entries.flow.async_init(
-        DOMAIN,
-        context={"source": SOURCE_SSDP},
-        data=SsdpServiceInfo(
-            ssdp_usn="mock_usn",
-            ssdp_st="mock_st",
-            ssdp_location=TEST_SSDP_LOCATION,
-            upnp={
-                "presentationURL": f"http://{TEST_HOST}/",
-                "friendlyName": TEST_NAME,
-            },
-        ),
+        DOMAIN, context={"source": SOURCE_SSDP}, data=discovery_info
     )
 
     assert result["type"] is FlowResultType.ABORT
@@ -216,19 +196,7 @@ async def test_ssdp_discovery_already_configured(
     mock_config_entry.add_to_hass(hass)
 
     result = await hass.config_entries.flow.async_init(
-        DOMAIN,
-        context={"source": SOURCE_SSDP},
-        data=SsdpServiceInfo(
-            ssdp_usn="mock_usn",
-            ssdp_st="mock_st",
-            ssdp_udn=TEST_UDN,
-            ssdp_location=TEST_SSDP_LOCATION,
-            upnp={
-                "presentationURL": f"http://{TEST_HOST}/",
-                "friendlyName": TEST_NAME,
-                "modelName": TEST_MODEL,
-            },
-        ),
+        DOMAIN, context={"source": SOURCE_SSDP}, data=SSDP_DISCOVERY_INFO
     )
 
     assert result["type"] is FlowResultType.ABORT
@@ -248,15 +216,12 @@ async def test_ssdp_discovery_already_configured_updates_host(
     result = await hass.config_entries.flow.async_init(
         DOMAIN,
         context={"source": SOURCE_SSDP},
-        data=SsdpServiceInfo(
-            ssdp_usn="mock_usn",
-            ssdp_st="mock_st",
-            ssdp_udn=TEST_UDN,
+        data=replace(
+            SSDP_DISCOVERY_INFO,
             ssdp_location=f"http://{new_host}:8080/description.xml",
             upnp={
+                **SSDP_DISCOVERY_INFO.upnp,
                 "presentationURL": f"http://{new_host}/",
-                "friendlyName": TEST_NAME,
-                "modelName": TEST_MODEL,
             },
         ),
     )
@@ -276,19 +241,7 @@ async def test_ssdp_discovery_cannot_connect(
     mock_hegel_client.ensure_connected.side_effect = OSError("Connection refused")
 
     result = await hass.config_entries.flow.async_init(
-        DOMAIN,
-        context={"source": SOURCE_SSDP},
-        data=SsdpServiceInfo(
-            ssdp_usn="mock_usn",
-            ssdp_st="mock_st",
-            ssdp_udn=TEST_UDN,
-            ssdp_location=TEST_SSDP_LOCATION,
-            upnp={
-                "presentationURL": f"http://{TEST_HOST}/",
-                "friendlyName": TEST_NAME,
-                "modelName": TEST_MODEL,
-            },
-        ),
+        DOMAIN, context={"source": SOURCE_SSDP}, data=SSDP_DISCOVERY_INFO
     )
 
     assert result["type"] is FlowResultType.ABORT
@@ -303,13 +256,10 @@ async def test_ssdp_discovery_unknown_model(
     result = await hass.config_entries.flow.async_init(
         DOMAIN,
         context={"source": SOURCE_SSDP},
-        data=SsdpServiceInfo(
-            ssdp_usn="mock_usn",
-            ssdp_st="mock_st",
-            ssdp_udn=TEST_UDN,
-            ssdp_location=TEST_SSDP_LOCATION,
+        data=replace(
+            SSDP_DISCOVERY_INFO,
             upnp={
-                "presentationURL": f"http://{TEST_HOST}/",
+                **SSDP_DISCOVERY_INFO.upnp,
                 "friendlyName": "Hegel Unknown",
                 "modelName": "UnknownModel",
             },
@@ -334,16 +284,10 @@ async def test_ssdp_discovery_multiple_services_same_device(
     result1 = await hass.config_entries.flow.async_init(
         DOMAIN,
         context={"source": SOURCE_SSDP},
-        data=SsdpServiceInfo(
+        data=replace(
+            SSDP_DISCOVERY_INFO,
             ssdp_usn=f"{TEST_UDN}::urn:schemas-upnp-org:service:RenderingControl:1",
             ssdp_st="urn:schemas-upnp-org:service:RenderingControl:1",
-            ssdp_udn=TEST_UDN,
-            ssdp_location=TEST_SSDP_LOCATION,
-            upnp={
-                "presentationURL": f"http://{TEST_HOST}/",
-                "friendlyName": TEST_NAME,
-                "modelName": TEST_MODEL,
-            },
         ),
     )
 
@@ -355,16 +299,10 @@ async def test_ssdp_discovery_multiple_services_same_device(
     result2 = await hass.config_entries.flow.async_init(
         DOMAIN,
         context={"source": SOURCE_SSDP},
-        data=SsdpServiceInfo(
+        data=replace(
+            SSDP_DISCOVERY_INFO,
             ssdp_usn=f"{TEST_UDN}::urn:schemas-upnp-org:service:AVTransport:1",
             ssdp_st="urn:schemas-upnp-org:service:AVTransport:1",
-            ssdp_udn=TEST_UDN,
-            ssdp_location=TEST_SSDP_LOCATION,
-            upnp={
-                "presentationURL": f"http://{TEST_HOST}/",
-                "friendlyName": TEST_NAME,
-                "modelName": TEST_MODEL,
-            },
         ),
     )
 
@@ -2,6 +2,9 @@
 
 from typing import Any
 
+from aiohttp.test_utils import TestClient
+import pytest
+
 from homeassistant import config_entries
 from homeassistant.components.repairs import DOMAIN as REPAIRS_DOMAIN
 from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
@@ -14,27 +17,53 @@ from tests.components.repairs import process_repair_fix_flow, start_repair_fix_f
 from tests.typing import ClientSessionGenerator
 
 
+def _entry_payload(entry: MockConfigEntry) -> dict[str, Any]:
+    """Return the stored config entry data for a mock config entry."""
+    return {
+        "created_at": entry.created_at.isoformat(),
+        "data": {},
+        "disabled_by": None,
+        "discovery_keys": {},
+        "domain": entry.domain,
+        "entry_id": entry.entry_id,
+        "minor_version": 1,
+        "modified_at": entry.modified_at.isoformat(),
+        "options": {},
+        "pref_disable_new_entities": False,
+        "pref_disable_polling": False,
+        "source": entry.source,
+        "subentries": [],
+        "title": "Title probably no-one will read",
+        "unique_id": None,
+        "version": 1,
+    }
+
+
+@pytest.fixture
+async def http_client(
+    hass: HomeAssistant, hass_client: ClientSessionGenerator
+) -> TestClient:
+    """Set up the homeassistant and repairs integrations and return a client."""
+    assert await async_setup_component(hass, HOMEASSISTANT_DOMAIN, {})
+    assert await async_setup_component(hass, REPAIRS_DOMAIN, {REPAIRS_DOMAIN: {}})
+    await hass.async_block_till_done()
+    return await hass_client()
+
+
 async def test_integration_not_found_confirm_step(
     hass: HomeAssistant,
-    hass_client: ClientSessionGenerator,
+    http_client: TestClient,
     issue_registry: ir.IssueRegistry,
 ) -> None:
     """Test the integration_not_found issue confirm step."""
-    assert await async_setup_component(hass, HOMEASSISTANT_DOMAIN, {})
-    await hass.async_block_till_done()
-    assert await async_setup_component(hass, REPAIRS_DOMAIN, {REPAIRS_DOMAIN: {}})
-    await hass.async_block_till_done()
-    MockConfigEntry(domain="test1").add_to_hass(hass)
-    assert await async_setup_component(hass, "test1", {}) is False
-    await hass.async_block_till_done()
     entry1 = MockConfigEntry(domain="test1")
     entry1.add_to_hass(hass)
+    assert await async_setup_component(hass, "test1", {}) is False
+    await hass.async_block_till_done()
     entry2 = MockConfigEntry(domain="test1")
     entry2.add_to_hass(hass)
     issue_id = "integration_not_found.test1"
 
-    http_client = await hass_client()
-
     issue = issue_registry.async_get_issue(HOMEASSISTANT_DOMAIN, issue_id)
     assert issue is not None
     assert issue.translation_placeholders == {"domain": "test1"}
@@ -67,23 +96,16 @@ async def test_integration_not_found_confirm_step(
 
 async def test_integration_not_found_ignore_step(
     hass: HomeAssistant,
-    hass_client: ClientSessionGenerator,
+    http_client: TestClient,
     issue_registry: ir.IssueRegistry,
 ) -> None:
     """Test the integration_not_found issue ignore step."""
-    assert await async_setup_component(hass, HOMEASSISTANT_DOMAIN, {})
-    await hass.async_block_till_done()
-    assert await async_setup_component(hass, REPAIRS_DOMAIN, {REPAIRS_DOMAIN: {}})
-    await hass.async_block_till_done()
-    MockConfigEntry(domain="test1").add_to_hass(hass)
-    assert await async_setup_component(hass, "test1", {}) is False
-    await hass.async_block_till_done()
     entry1 = MockConfigEntry(domain="test1")
     entry1.add_to_hass(hass)
+    assert await async_setup_component(hass, "test1", {}) is False
+    await hass.async_block_till_done()
     issue_id = "integration_not_found.test1"
 
-    http_client = await hass_client()
-
     issue = issue_registry.async_get_issue(HOMEASSISTANT_DOMAIN, issue_id)
     assert issue is not None
     assert issue.translation_placeholders == {"domain": "test1"}
@@ -119,18 +141,11 @@ async def test_integration_not_found_ignore_step(
 
 async def test_orphaned_config_entry_confirm_step(
     hass: HomeAssistant,
-    hass_client: ClientSessionGenerator,
+    http_client: TestClient,
     hass_storage: dict[str, Any],
     issue_registry: ir.IssueRegistry,
 ) -> None:
     """Test the orphaned_config_entry issue confirm step."""
-    assert await async_setup_component(hass, HOMEASSISTANT_DOMAIN, {})
-    await hass.async_block_till_done()
-    assert await async_setup_component(hass, REPAIRS_DOMAIN, {REPAIRS_DOMAIN: {}})
-    await hass.async_block_till_done()
-
-    http_client = await hass_client()
-
     entry = MockConfigEntry(domain="test_issued", source=config_entries.SOURCE_IGNORE)
     entry_valid = MockConfigEntry(domain="test_valid")
     issue_id = f"orphaned_ignored_entry.{entry.entry_id}"
@@ -138,46 +153,7 @@ async def test_orphaned_config_entry_confirm_step(
     hass_storage[config_entries.STORAGE_KEY] = {
         "version": 1,
         "minor_version": 5,
-        "data": {
-            "entries": [
-                {
-                    "created_at": entry.created_at.isoformat(),
-                    "data": {},
-                    "disabled_by": None,
-                    "discovery_keys": {},
-                    "domain": "test_issued",
-                    "entry_id": entry.entry_id,
-                    "minor_version": 1,
-                    "modified_at": entry.modified_at.isoformat(),
-                    "options": {},
-                    "pref_disable_new_entities": False,
-                    "pref_disable_polling": False,
-                    "source": "ignore",
-                    "subentries": [],
-                    "title": "Title probably no-one will read",
-                    "unique_id": None,
-                    "version": 1,
-                },
-                {
-                    "created_at": entry_valid.created_at.isoformat(),
-                    "data": {},
-                    "disabled_by": None,
-                    "discovery_keys": {},
-                    "domain": "test_valid",
-                    "entry_id": entry_valid.entry_id,
-                    "minor_version": 1,
-                    "modified_at": entry_valid.modified_at.isoformat(),
-                    "options": {},
-                    "pref_disable_new_entities": False,
-                    "pref_disable_polling": False,
-                    "source": "user",
-                    "subentries": [],
-                    "title": "Title probably no-one will read",
-                    "unique_id": None,
-                    "version": 1,
-                },
-            ]
-        },
+        "data": {"entries": [_entry_payload(entry), _entry_payload(entry_valid)]},
     }
 
     await hass.config_entries.async_initialize()
@@ -218,18 +194,11 @@ async def test_orphaned_config_entry_confirm_step(
 
 async def test_orphaned_config_entry_ignore_step(
     hass: HomeAssistant,
-    hass_client: ClientSessionGenerator,
+    http_client: TestClient,
     hass_storage: dict[str, Any],
     issue_registry: ir.IssueRegistry,
 ) -> None:
     """Test the orphaned_config_entry issue ignore step."""
-    assert await async_setup_component(hass, HOMEASSISTANT_DOMAIN, {})
-    await hass.async_block_till_done()
-    assert await async_setup_component(hass, REPAIRS_DOMAIN, {REPAIRS_DOMAIN: {}})
-    await hass.async_block_till_done()
-
-    http_client = await hass_client()
-
     entry = MockConfigEntry(domain="test_issued", source=config_entries.SOURCE_IGNORE)
     entry_valid = MockConfigEntry(domain="test_valid")
     issue_id = f"orphaned_ignored_entry.{entry.entry_id}"
@@ -237,46 +206,7 @@ async def test_orphaned_config_entry_ignore_step(
     hass_storage[config_entries.STORAGE_KEY] = {
         "version": 1,
         "minor_version": 5,
-        "data": {
-            "entries": [
-                {
-                    "created_at": entry.created_at.isoformat(),
-                    "data": {},
-                    "disabled_by": None,
-                    "discovery_keys": {},
-                    "domain": "test_issued",
-                    "entry_id": entry.entry_id,
-                    "minor_version": 1,
-                    "modified_at": entry.modified_at.isoformat(),
-                    "options": {},
-                    "pref_disable_new_entities": False,
-                    "pref_disable_polling": False,
-                    "source": "ignore",
-                    "subentries": [],
-                    "title": "Title probably no-one will read",
-                    "unique_id": None,
-                    "version": 1,
-                },
-                {
-                    "created_at": entry_valid.created_at.isoformat(),
-                    "data": {},
-                    "disabled_by": None,
-                    "discovery_keys": {},
-                    "domain": "test_valid",
-                    "entry_id": entry_valid.entry_id,
-                    "minor_version": 1,
-                    "modified_at": entry_valid.modified_at.isoformat(),
-                    "options": {},
-                    "pref_disable_new_entities": False,
-                    "pref_disable_polling": False,
-                    "source": "user",
-                    "subentries": [],
-                    "title": "Title probably no-one will read",
-                    "unique_id": None,
-                    "version": 1,
-                },
-            ]
-        },
+        "data": {"entries": [_entry_payload(entry), _entry_payload(entry_valid)]},
     }
 
     await hass.config_entries.async_initialize()
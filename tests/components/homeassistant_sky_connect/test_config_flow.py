@@ -1,6 +1,6 @@
 """Test the Home Assistant SkyConnect config flow."""
 
-from collections.abc import Generator
+from collections.abc import Awaitable, Callable, Generator
 from unittest.mock import AsyncMock, Mock, call, patch
 
 import pytest
@@ -36,6 +36,14 @@ from .common import USB_DATA_SKY, USB_DATA_ZBT1
 
 from tests.common import MockConfigEntry
 
+pytestmark = pytest.mark.parametrize(
+    ("usb_data", "model"),
+    [
+        (USB_DATA_SKY, "Home Assistant SkyConnect"),
+        (USB_DATA_ZBT1, "Home Assistant Connect ZBT-1"),
+    ],
+)
+
 
 @pytest.fixture(name="supervisor")
 def mock_supervisor_fixture() -> Generator[None]:
@@ -57,19 +65,32 @@ def setup_entry_fixture() -> Generator[AsyncMock]:
         yield mock_setup_entry
 
 
-@pytest.mark.parametrize(
-    ("usb_data", "model"),
-    [
-        (
-            USB_DATA_SKY,
-            "Home Assistant SkyConnect",
-        ),
-        (
-            USB_DATA_ZBT1,
-            "Home Assistant Connect ZBT-1",
-        ),
-    ],
-)
+def _mock_install_firmware_step(
+    device: str, firmware_version: str
+) -> Callable[..., Awaitable[ConfigFlowResult]]:
+    """Return an _install_firmware_step replacement that fakes a probe."""
+
+    async def mock_install_firmware_step(
+        self,
+        fw_update_url: str,
+        fw_type: str,
+        firmware_name: str,
+        expected_installed_firmware_type: ApplicationType,
+        step_id: str,
+        next_step_id: str,
+    ) -> ConfigFlowResult:
+        self._probed_firmware_info = FirmwareInfo(
+            device=device,
+            firmware_type=expected_installed_firmware_type,
+            firmware_version=firmware_version,
+            owners=[],
+            source="probe",
+        )
+        return await getattr(self, f"async_step_{next_step_id}")()
+
+    return mock_install_firmware_step
+
+
 async def test_config_flow_zigbee(
     usb_data: UsbServiceInfo,
     model: str,
@@ -89,29 +110,11 @@ async def test_config_flow_zigbee(
     assert description_placeholders is not None
     assert description_placeholders["model"] == model
 
-    async def mock_install_firmware_step(
-        self,
-        fw_update_url: str,
-        fw_type: str,
-        firmware_name: str,
-        expected_installed_firmware_type: ApplicationType,
-        step_id: str,
-        next_step_id: str,
-    ) -> ConfigFlowResult:
-        self._probed_firmware_info = FirmwareInfo(
-            device=usb_data.device,
-            firmware_type=expected_installed_firmware_type,
-            firmware_version=fw_version,
-            owners=[],
-            source="probe",
-        )
-        return await getattr(self, f"async_step_{next_step_id}")()
-
     with (
         patch(
             "homeassistant.components.homeassistant_hardware.firmware_config_flow.BaseFirmwareConfigFlow._install_firmware_step",
             autospec=True,
-            side_effect=mock_install_firmware_step,
+            side_effect=_mock_install_firmware_step(usb_data.device, fw_version),
         ),
     ):
         pick_result = await hass.config_entries.flow.async_configure(
@@ -152,19 +155,6 @@ async def test_config_flow_zigbee(
 
 
 @pytest.mark.usefixtures("addon_installed", "supervisor")
-@pytest.mark.parametrize(
-    ("usb_data", "model"),
-    [
-        (
-            USB_DATA_SKY,
-            "Home Assistant SkyConnect",
-        ),
-        (
-            USB_DATA_ZBT1,
-            "Home Assistant Connect ZBT-1",
-        ),
-    ],
-)
 async def test_config_flow_thread(
     usb_data: UsbServiceInfo,
     model: str,
@@ -185,29 +175,11 @@ async def test_config_flow_thread(
     assert description_placeholders is not None
     assert description_placeholders["model"] == model
 
-    async def mock_install_firmware_step(
-        self,
-        fw_update_url: str,
-        fw_type: str,
-        firmware_name: str,
-        expected_installed_firmware_type: ApplicationType,
-        step_id: str,
-        next_step_id: str,
-    ) -> ConfigFlowResult:
-        self._probed_firmware_info = FirmwareInfo(
-            device=usb_data.device,
-            firmware_type=expected_installed_firmware_type,
-            firmware_version=fw_version,
-            owners=[],
-            source="probe",
-        )
-        return await getattr(self, f"async_step_{next_step_id}")()
-
     with (
         patch(
             "homeassistant.components.homeassistant_hardware.firmware_config_flow.BaseFirmwareConfigFlow._install_firmware_step",
             autospec=True,
-            side_effect=mock_install_firmware_step,
+            side_effect=_mock_install_firmware_step(usb_data.device, fw_version),
         ),
     ):
         result = await hass.config_entries.flow.async_configure(
@@ -246,13 +218,6 @@ async def test_config_flow_thread(
     assert len(flows) == 0
 
 
-@pytest.mark.parametrize(
-    ("usb_data", "model"),
-    [
-        (USB_DATA_SKY, "Home Assistant SkyConnect"),
-        (USB_DATA_ZBT1, "Home Assistant Connect ZBT-1"),
-    ],
-)
 async def test_options_flow(
     usb_data: UsbServiceInfo, model: str, hass: HomeAssistant
 ) -> None:
@@ -285,24 +250,6 @@ async def test_options_flow(
     assert description_placeholders["firmware_type"] == "spinel"
     assert description_placeholders["model"] == model
 
-    async def mock_install_firmware_step(
-        self,
-        fw_update_url: str,
-        fw_type: str,
-        firmware_name: str,
-        expected_installed_firmware_type: ApplicationType,
-        step_id: str,
-        next_step_id: str,
-    ) -> ConfigFlowResult:
-        self._probed_firmware_info = FirmwareInfo(
-            device=usb_data.device,
-            firmware_type=expected_installed_firmware_type,
-            firmware_version="7.4.4.0 build 0",
-            owners=[],
-            source="probe",
-        )
-        return await getattr(self, f"async_step_{next_step_id}")()
-
     with (
         patch(
             "homeassistant.components.homeassistant_hardware.firmware_config_flow.guess_hardware_owners",
@@ -311,7 +258,7 @@ async def test_options_flow(
         patch(
             "homeassistant.components.homeassistant_hardware.firmware_config_flow.BaseFirmwareOptionsFlow._install_firmware_step",
             autospec=True,
-            side_effect=mock_install_firmware_step,
+            side_effect=_mock_install_firmware_step(usb_data.device, "7.4.4.0 build 0"),
         ),
     ):
         pick_result = await hass.config_entries.options.async_configure(
@@ -343,13 +290,6 @@ async def test_options_flow(
 
 
 @pytest.mark.usefixtures("supervisor_client")
-@pytest.mark.parametrize(
-    ("usb_data", "model"),
-    [
-        (USB_DATA_SKY, "Home Assistant SkyConnect"),
-        (USB_DATA_ZBT1, "Home Assistant Connect ZBT-1"),
-    ],
-)
 async def test_options_flow_multipan_uninstall(
     usb_data: UsbServiceInfo, model: str, hass: HomeAssistant
 ) -> None:
@@ -439,13 +379,6 @@ async def test_options_flow_multipan_uninstall(
     assert config_entry.data["firmware"] == "ezsp"
 
 
-@pytest.mark.parametrize(
-    ("usb_data", "model"),
-    [
-        (USB_DATA_SKY, "Home Assistant SkyConnect"),
-        (USB_DATA_ZBT1, "Home Assistant Connect ZBT-1"),
-    ],
-)
 async def test_firmware_callback_auto_creates_entry(
     usb_data: UsbServiceInfo,
     model: str,
@@ -508,13 +441,6 @@ async def test_firmware_callback_auto_creates_entry(
     assert not hass.config_entries.flow.async_progress_by_handler(DOMAIN)
 
 
-@pytest.mark.parametrize(
-    ("usb_data", "model"),
-    [
-        (USB_DATA_SKY, "Home Assistant SkyConnect"),
-        (USB_DATA_ZBT1, "Home Assistant Connect ZBT-1"),
-    ],
-)
 async def test_duplicate_usb_discovery_aborts_early(
     usb_data: UsbServiceInfo, model: str, hass: HomeAssistant
 ) -> None:
@@ -546,13 +472,6 @@ async def test_duplicate_usb_discovery_aborts_early(
     assert result["reason"] == "already_configured"
 
 
-@pytest.mark.parametrize(
-    ("usb_data", "model"),
-    [
-        (USB_DATA_SKY, "Home Assistant SkyConnect"),
-        (USB_DATA_ZBT1, "Home Assistant Connect ZBT-1"),
-    ],
-)
 async def test_firmware_callback_updates_existing_entry(
     usb_data: UsbServiceInfo, model: str, hass: HomeAssistant
 ) -> None:
@@ -1,7 +1,6 @@
 """Common fixtures for the Homevolt tests."""
 
 from collections.abc import Generator
-import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from homevolt import DeviceMetadata, Sensor
@@ -11,10 +10,19 @@ from homeassistant.components.homevolt.const import DOMAIN
 from homeassistant.const import CONF_HOST, CONF_PASSWORD, Platform
 from homeassistant.core import HomeAssistant
 
-from tests.common import MockConfigEntry, load_fixture
+from tests.common import MockConfigEntry, load_json_object_fixture
 
 DEVICE_IDENTIFIER = "ems_40580137858664"
 
+SENSORS_DATA = load_json_object_fixture("sensors.json", DOMAIN)
+SCHEDULE_DATA = load_json_object_fixture("schedule.json", DOMAIN)
+DEVICE_METADATA = {
+    key: DeviceMetadata(name=metadata["name"], model=metadata["model"])
+    for key, metadata in load_json_object_fixture(
+        "device_metadata.json", DOMAIN
+    ).items()
+}
+
 
 @pytest.fixture
 def mock_setup_entry() -> Generator[AsyncMock]:
@@ -59,29 +67,19 @@ def mock_homevolt_client() -> Generator[MagicMock]:
 
         client.unique_id = "40580137858664"
 
-        # Load sensor data from fixture and convert to Sensor objects
-        sensors_data = json.loads(load_fixture("sensors.json", DOMAIN))
+        # Sensors are built per test, as tests update their values
         client.sensors = {
             key: Sensor(
                 value=value,
                 type=key,
                 device_identifier=DEVICE_IDENTIFIER,
             )
-            for key, value in sensors_data.items()
+            for key, value in SENSORS_DATA.items()
         }
 
-        # Load device metadata from fixture and convert to DeviceMetadata objects
-        metadata_data = json.loads(load_fixture("device_metadata.json", DOMAIN))
-        client.device_metadata = {
-            key: DeviceMetadata(
-                name=metadata["name"],
-                model=metadata["model"],
-            )
-            for key, metadata in metadata_data.items()
-        }
+        client.device_metadata = dict(DEVICE_METADATA)
 
-        # Load schedule data from fixture
-        client.current_schedule = json.loads(load_fixture("schedule.json", DOMAIN))
+        client.current_schedule = SCHEDULE_DATA
 
         # Switch (local mode) support
         client.local_mode_enabled = False